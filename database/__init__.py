@@ -15,37 +15,60 @@ The package is organized into the following modules:
 
 __version__ = "0.1.0"
 
-# Try to import the main classes, but gracefully handle missing dependencies
-try:
-    from .config import WeaviateConfig, DatabaseSettings
-    from .schema import RecipeSchema
-    from .models import RecipeDocument
-    from .core import WeaviateManager, RecipeVectorDatabase, setup_database
-    from .loaders import RecipeDataLoader, MarkdownRecipeParser
-    from .utils import setup_logging, get_logger, set_debug_mode
-    
-    __all__ = [
-        # Configuration
-        "WeaviateConfig",
-        "DatabaseSettings",
-        # Schema
-        "RecipeSchema",
-        # Models
-        "RecipeDocument",
-        # Core functionality
-        "WeaviateManager", 
-        "RecipeVectorDatabase",
-        "setup_database",
-        # Data loading
-        "RecipeDataLoader",
-        "MarkdownRecipeParser",
-        # Utilities
-        "setup_logging",
-        "get_logger",
-        "set_debug_mode"
-    ]
-except ImportError as e:
-    print(f"Warning: Some database modules could not be imported: {e}")
-    print("Install dependencies with: pip install weaviate-client")
+import importlib
+import logging
+
+# Public names and the submodule that provides them. Submodules are imported
+# on first attribute access (PEP 562) so that importing the package does not
+# pull in the weaviate client until it is actually needed.
+_LAZY_IMPORTS = {
+    # Configuration
+    "WeaviateConfig": "config",
+    "DatabaseSettings": "config",
+    "SETTINGS": "config",
+    "ConfigurationError": "config",
+    # Schema
+    "RecipeSchema": "schema",
+    # Models
+    "RecipeDocument": "models",
+    "RecipeDocumentDict": "models",
+    # Core functionality
+    "WeaviateManager": "core",
+    "RecipeVectorDatabase": "core",
+    "RecipeHit": "core",
+    "NotConnectedError": "core",
+    "setup_database": "core",
+    # Data loading
+    "RecipeDataLoader": "loaders",
+    "MarkdownRecipeParser": "loaders",
+    # Utilities
+    "setup_logging": "utils",
+    "get_logger": "utils",
+    "set_debug_mode": "utils",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+# Warn about a broken submodule once instead of on every failed access
+_IMPORT_WARNED = False
+
+
+def __getattr__(name):
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
     
-    __all__ = []
+    global _IMPORT_WARNED
+    try:
+        module = importlib.import_module(f"{__name__}.{_LAZY_IMPORTS[name]}")
+    except ImportError as e:
+        if not _IMPORT_WARNED:
+            _IMPORT_WARNED = True
+            logging.getLogger(__name__).warning("Some database modules could not be imported: %s", e)
+        raise
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -3,9 +3,11 @@ Configuration module for database package.
 """
 
 from .database_config import WeaviateConfig
-from .settings import DatabaseSettings
+from .settings import DatabaseSettings, SETTINGS, ConfigurationError
 
 __all__ = [
     "WeaviateConfig",
     "DatabaseSettings",
+    "SETTINGS",
+    "ConfigurationError",
 ]
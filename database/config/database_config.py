@@ -5,20 +5,70 @@ This module provides the database configuration class for connecting
 to Weaviate vector database using v4 API.
 """
 
+import hashlib
+import importlib.util
 import logging
-from typing import Optional
+import threading
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
 
-from .settings import DatabaseSettings
+from .settings import SETTINGS
 
 logger = logging.getLogger(__name__)
 
-# Try to import weaviate with graceful fallback
-try:
-    import weaviate
-    WEAVIATE_AVAILABLE = True
-except ImportError:
-    WEAVIATE_AVAILABLE = False
-    weaviate = None
+# weaviate (with grpc, httpx and pydantic) is imported only when a client is
+# created, so CLI startup and --help do not pay for it
+WEAVIATE_AVAILABLE = importlib.util.find_spec("weaviate") is not None
+
+# Process-wide cache of live clients keyed by (host, port, credentials hash),
+# so repeated connects reuse the same HTTP/gRPC connection instead of paying
+# a fresh handshake every time.
+_CLIENT_CACHE: Dict[Tuple[str, int, str], "weaviate.WeaviateClient"] = {}
+_CLIENT_CACHE_LOCK = threading.Lock()
+
+# Number of managers currently holding each cached client. Idle clients
+# (count 0) stay open for reuse until the pool grows past its size limit.
+_CLIENT_REFCOUNTS: Dict[Tuple[str, int, str], int] = {}
+
+# Cache keys whose server already passed the client's startup checks; later
+# reconnects to the same server skip them to save the extra round-trips.
+_INIT_CHECKED_KEYS = set()
+
+
+def close_cached_clients() -> None:
+    """Close all cached Weaviate clients and empty the cache."""
+    with _CLIENT_CACHE_LOCK:
+        clients = list(_CLIENT_CACHE.items())
+        _CLIENT_CACHE.clear()
+        _CLIENT_REFCOUNTS.clear()
+    _close_clients(clients)
+
+
+def _close_clients(clients: List[Tuple[Tuple[str, int, str], "weaviate.WeaviateClient"]]) -> None:
+    """Close clients removed from the cache; called without holding the lock."""
+    for key, client in clients:
+        try:
+            client.close()
+        except Exception as e:
+            logger.warning("Failed to close Weaviate client for %s:%s: %s", key[0], key[1], e)
+
+
+def _evict_idle_clients(max_size: int) -> List[Tuple[Tuple[str, int, str], "weaviate.WeaviateClient"]]:
+    """
+    Remove idle cached clients until the pool is below max_size (caller holds the lock).
+    
+    Returns:
+        The removed (key, client) pairs, to be closed once the lock is released
+    """
+    evicted = []
+    for key in [key for key, count in _CLIENT_REFCOUNTS.items() if count <= 0]:
+        if len(_CLIENT_CACHE) < max_size:
+            break
+        client = _CLIENT_CACHE.pop(key, None)
+        del _CLIENT_REFCOUNTS[key]
+        if client is not None:
+            evicted.append((key, client))
+    return evicted
 
 
 class WeaviateConfig:
@@ -31,7 +81,9 @@ class WeaviateConfig:
         openai_api_key: Optional[str] = None,
         batch_size: Optional[int] = None,
         timeout: Optional[int] = None,
-        recipe_class_name: Optional[str] = None
+        recipe_class_name: Optional[str] = None,
+        concurrent_requests: Optional[int] = None,
+        grpc_port: Optional[int] = None
     ):
         """
         Initialize Weaviate configuration.
@@ -43,45 +95,169 @@ class WeaviateConfig:
             batch_size: Batch size for bulk operations
             timeout: Connection timeout in seconds
             recipe_class_name: Name of the recipe collection
+            concurrent_requests: Number of batch requests sent in parallel
+            grpc_port: Weaviate gRPC port
         """
-        self.url = url or DatabaseSettings.WEAVIATE_URL
-        self.api_key = api_key or DatabaseSettings.WEAVIATE_API_KEY
-        self.openai_api_key = openai_api_key or DatabaseSettings.OPENAI_API_KEY
-        self.batch_size = batch_size or DatabaseSettings.WEAVIATE_BATCH_SIZE
-        self.timeout = timeout or DatabaseSettings.WEAVIATE_TIMEOUT
-        self.recipe_class_name = recipe_class_name or DatabaseSettings.RECIPE_CLASS_NAME
+        self.url = url or SETTINGS.WEAVIATE_URL
+        self.api_key = api_key or SETTINGS.WEAVIATE_API_KEY
+        self.openai_api_key = openai_api_key or SETTINGS.OPENAI_API_KEY
+        self.batch_size = batch_size or SETTINGS.WEAVIATE_BATCH_SIZE
+        self.timeout = timeout or SETTINGS.WEAVIATE_TIMEOUT
+        self.recipe_class_name = recipe_class_name or SETTINGS.RECIPE_CLASS_NAME
+        self.concurrent_requests = concurrent_requests or SETTINGS.WEAVIATE_CONCURRENT_REQUESTS
+        self.grpc_port = grpc_port or SETTINGS.WEAVIATE_GRPC_PORT
+    
+    def _credentials_hash(self) -> str:
+        """Hash the credentials so they can be part of the cache key without being stored in clear."""
+        credentials = f"{self.api_key}\0{self.openai_api_key}"
+        return hashlib.sha256(credentials.encode("utf-8")).hexdigest()
     
     def get_client(self):
-        """Create and return a Weaviate client instance."""
+        """
+        Return a Weaviate client instance.
+        
+        A live client for the same host, port and credentials is reused from
+        the process-wide cache; a new one is created if none exists or the
+        cached one is no longer ready. Each call takes a reference that must
+        be returned with release_client().
+        """
         if not WEAVIATE_AVAILABLE:
             raise ImportError("weaviate package is required. Install with: pip install weaviate-client")
         
+        headers = self._headers()
+        host, port, secure = self._parse_url()
+        
+        cache_key = (host, port, self._credentials_hash())
+        
+        # The readiness check and the connect are network calls, so they run
+        # without the lock; a slow host must not block other threads' pool access.
+        # A reference is taken first so the client is not evicted meanwhile.
+        with _CLIENT_CACHE_LOCK:
+            client = _CLIENT_CACHE.get(cache_key)
+            if client is not None:
+                _CLIENT_REFCOUNTS[cache_key] = _CLIENT_REFCOUNTS.get(cache_key, 0) + 1
+        
+        if client is not None:
+            try:
+                if client.is_ready():
+                    return client
+            except Exception as e:
+                logger.warning("Cached Weaviate client is unusable, reconnecting: %s", e)
+            stale = []
+            with _CLIENT_CACHE_LOCK:
+                # Holders of the stale client release against its replacement
+                if cache_key in _CLIENT_REFCOUNTS:
+                    _CLIENT_REFCOUNTS[cache_key] = max(0, _CLIENT_REFCOUNTS[cache_key] - 1)
+                if _CLIENT_CACHE.get(cache_key) is client:
+                    del _CLIENT_CACHE[cache_key]
+                    stale.append((cache_key, client))
+            _close_clients(stale)
+        
+        client = self._connect(
+            host, port, secure, headers,
+            skip_init_checks=cache_key in _INIT_CHECKED_KEYS
+        )
+        
+        with _CLIENT_CACHE_LOCK:
+            existing = _CLIENT_CACHE.get(cache_key)
+            if existing is not None:
+                # Another thread connected to the same server meanwhile; use its client
+                surplus = [(cache_key, client)]
+                client = existing
+                evicted = []
+            else:
+                surplus = []
+                evicted = _evict_idle_clients(SETTINGS.WEAVIATE_POOL_SIZE)
+                _CLIENT_CACHE[cache_key] = client
+                _INIT_CHECKED_KEYS.add(cache_key)
+            _CLIENT_REFCOUNTS[cache_key] = _CLIENT_REFCOUNTS.get(cache_key, 0) + 1
+        _close_clients(surplus + evicted)
+        return client
+    
+    def release_client(self, client) -> None:
+        """
+        Return a reference taken with get_client().
+        
+        The client stays open for reuse while the pool is within
+        WEAVIATE_POOL_SIZE; once the pool is over the limit, clients that
+        are no longer referenced are closed.
+        """
+        host, port, _ = self._parse_url()
+        cache_key = (host, port, self._credentials_hash())
+        with _CLIENT_CACHE_LOCK:
+            if cache_key not in _CLIENT_REFCOUNTS:
+                return
+            _CLIENT_REFCOUNTS[cache_key] = max(0, _CLIENT_REFCOUNTS[cache_key] - 1)
+            evicted = []
+            if len(_CLIENT_CACHE) > SETTINGS.WEAVIATE_POOL_SIZE:
+                evicted = _evict_idle_clients(SETTINGS.WEAVIATE_POOL_SIZE + 1)
+        _close_clients(evicted)
+    
+    def get_async_client(self):
+        """
+        Create a Weaviate async client instance (not yet connected).
+        
+        Async clients are bound to the event loop they connect on, so they
+        are not shared through the process-wide cache; the caller owns the
+        client and must await connect() and close().
+        """
+        if not WEAVIATE_AVAILABLE:
+            raise ImportError("weaviate package is required. Install with: pip install weaviate-client")
+        
+        import weaviate
+        
+        host, port, secure = self._parse_url()
+        return weaviate.use_async_with_custom(
+            http_host=host,
+            http_port=port,
+            http_secure=secure,
+            grpc_host=host,
+            grpc_port=self.grpc_port,
+            grpc_secure=secure,
+            headers=self._headers(),
+            auth_credentials=weaviate.auth.AuthApiKey(self.api_key) if self.api_key else None
+        )
+    
+    def _headers(self) -> Dict[str, str]:
+        """Build the additional request headers for the client."""
         headers = {}
         if self.openai_api_key:
             headers["X-OpenAI-Api-Key"] = self.openai_api_key
+        return headers
+    
+    def _parse_url(self) -> Tuple[str, int, bool]:
+        """
+        Split the configured URL into host, port and TLS flag.
         
-        # Extract host and port from URL
-        url_parts = self.url.replace('http://', '').replace('https://', '')
-        if ':' in url_parts:
-            host, port = url_parts.split(':')
-            port = int(port)
-        else:
-            host = url_parts
-            port = 8080
-        
-        # Use Weaviate v4 client connection
-        if self.api_key:
-            client = weaviate.connect_to_local(
-                host=host,
-                port=port,
-                headers=headers,
-                auth_credentials=weaviate.auth.AuthApiKey(self.api_key)
-            )
-        else:
-            client = weaviate.connect_to_local(
-                host=host,
-                port=port,
-                headers=headers
-            )
+        Returns:
+            Tuple of (host, port, secure)
+        """
+        url = self.url if "://" in self.url else f"http://{self.url}"
+        parts = urlsplit(url)
+        secure = parts.scheme == "https"
+        port = parts.port or (443 if secure else 8080)
+        return parts.hostname or "localhost", port, secure
+    
+    def _connect(
+        self,
+        host: str,
+        port: int,
+        secure: bool,
+        headers: Dict[str, str],
+        skip_init_checks: bool = False
+    ):
+        """Open a new Weaviate client connection."""
+        import weaviate
         
-        return client
+        # Use Weaviate v4 client connection with gRPC enabled
+        return weaviate.connect_to_custom(
+            http_host=host,
+            http_port=port,
+            http_secure=secure,
+            grpc_host=host,
+            grpc_port=self.grpc_port,
+            grpc_secure=secure,
+            headers=headers,
+            auth_credentials=weaviate.auth.AuthApiKey(self.api_key) if self.api_key else None,
+            skip_init_checks=skip_init_checks
+        )
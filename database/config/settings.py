@@ -2,25 +2,110 @@
 Environment variables and application settings for the database module.
 """
 
+import logging
 import os
+from dataclasses import dataclass, fields
 
+logger = logging.getLogger(__name__)
 
+_CPU_COUNT = os.cpu_count() or 1
+
+
+class ConfigurationError(ValueError):
+    """Raised when an environment variable holds an invalid setting."""
+
+
+@dataclass(frozen=True)
 class DatabaseSettings:
-    """Central configuration settings for the database module."""
-    
+    """
+    Central configuration settings for the database module.
+
+    Read once from the environment into the module-level SETTINGS instance;
+    code should hold on to that instance rather than re-reading os.environ.
+    """
+
     # Weaviate Connection Settings
-    WEAVIATE_URL = os.getenv('WEAVIATE_URL', 'http://localhost:8080')
-    WEAVIATE_API_KEY = os.getenv('WEAVIATE_API_KEY', '')
-    WEAVIATE_TIMEOUT = int(os.getenv('WEAVIATE_TIMEOUT', '30'))
-    
-    # OpenAI Settings
-    OPENAI_API_KEY = os.getenv('OPENAI_APIKEY', '')
-    
+    WEAVIATE_URL: str = 'http://localhost:8080'
+    WEAVIATE_API_KEY: str = ''
+    WEAVIATE_GRPC_PORT: int = 50051
+    WEAVIATE_TIMEOUT: int = 30
+    # Maximum number of pooled clients (one per server/credentials pair)
+    WEAVIATE_POOL_SIZE: int = min(32, 4 * _CPU_COUNT)
+
+    # OpenAI Settings (read from OPENAI_APIKEY)
+    OPENAI_API_KEY: str = ''
+
     # Batch Processing Settings
-    WEAVIATE_BATCH_SIZE = int(os.getenv('WEAVIATE_BATCH_SIZE', '100'))
-    
+    WEAVIATE_BATCH_SIZE: int = 100
+    WEAVIATE_AUTOTUNE: bool = False
+    WEAVIATE_CONCURRENT_REQUESTS: int = min(8, _CPU_COUNT)
+    # Encode recipe JSON with orjson when it is installed
+    WEAVIATE_USE_ORJSON: bool = False
+    # Retries of an async insert request after connection errors, timeouts, 429 or 5xx
+    WEAVIATE_BATCH_RETRIES: int = 4
+    # Processes parsing recipe files when loading a directory (0: all but one core)
+    INGEST_PARSE_WORKERS: int = 1
+
+    # Seconds a cached object count stays valid
+    COUNT_CACHE_TTL: float = 2.0
+    # Seconds a describe()/health_check() result stays valid
+    DESCRIBE_CACHE_TTL: float = 5.0
+
+    # Search result cache: exact query strings, then similar queries
+    # (the semantic tier is used when fastembed is installed)
+    EXACT_CACHE_SIZE: int = 512
+    SEMANTIC_CACHE_SIZE: int = 1024
+    SEMANTIC_CACHE_THRESHOLD: float = 0.95
+    SEMANTIC_CACHE_TTL: float = 300.0
+    SEMANTIC_CACHE_MODEL: str = 'BAAI/bge-small-en-v1.5'
+    # Embed search queries client-side with openai and search by vector. Off by
+    # default: it only ranks correctly if the collection was vectorized with
+    # DEFAULT_EMBEDDING_MODEL, as collections created by RecipeSchema are.
+    QUERY_EMBEDDING_CLIENT_SIDE: bool = False
+    # Query embeddings cached when QUERY_EMBEDDING_CLIENT_SIDE is on (0 disables embedding)
+    QUERY_EMBEDDING_CACHE_SIZE: int = 1024
+
     # Collection Settings
-    RECIPE_CLASS_NAME = os.getenv('RECIPE_CLASS_NAME', 'Recipe')
-    
-    # Default embedding model
-    DEFAULT_EMBEDDING_MODEL = "text-embedding-3-small"
+    RECIPE_CLASS_NAME: str = 'Recipe'
+    # Vector index for new collections: "hnsw" or "flat_rq" (Weaviate >= 1.32)
+    WEAVIATE_INDEX: str = 'hnsw'
+
+    # Default embedding model (not configurable through the environment)
+    DEFAULT_EMBEDDING_MODEL: str = "text-embedding-3-small"
+
+    @classmethod
+    def from_env(cls) -> "DatabaseSettings":
+        """
+        Build settings from environment variables, falling back to the defaults.
+
+        Returns:
+            DatabaseSettings instance
+
+        Raises:
+            ConfigurationError: If a variable cannot be parsed as its setting's type
+        """
+        env_names = {"OPENAI_API_KEY": "OPENAI_APIKEY"}
+        values = {}
+        for field in fields(cls):
+            if field.name == "DEFAULT_EMBEDDING_MODEL":
+                continue
+            env_name = env_names.get(field.name, field.name)
+            raw = os.getenv(env_name)
+            if raw is None:
+                continue
+            try:
+                if field.type is bool:
+                    values[field.name] = raw == '1'
+                elif field.type is int:
+                    values[field.name] = int(raw)
+                elif field.type is float:
+                    values[field.name] = float(raw)
+                else:
+                    values[field.name] = raw
+            except ValueError as e:
+                logger.error("Invalid value for %s: %r", env_name, raw)
+                raise ConfigurationError(f"Invalid value for {env_name}: {raw!r}") from e
+        return cls(**values)
+
+
+SETTINGS = DatabaseSettings.from_env()
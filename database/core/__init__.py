@@ -3,10 +3,12 @@ Core module for database package.
 """
 
 from .weaviate_manager import WeaviateManager, setup_database
-from .recipe_vector_database import RecipeVectorDatabase
+from .recipe_vector_database import RecipeVectorDatabase, RecipeHit, NotConnectedError
 
 __all__ = [
     "WeaviateManager",
     "setup_database", 
     "RecipeVectorDatabase",
+    "RecipeHit",
+    "NotConnectedError",
 ]
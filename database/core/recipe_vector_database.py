@@ -5,25 +5,148 @@ This module provides high-level operations for storing, retrieving,
 and searching recipes in the Weaviate vector database using v4 API.
 """
 
+import asyncio
+import importlib.util
 import logging
-from typing import List, Dict, Any, Optional
-from datetime import datetime
+import multiprocessing
+import os
+import random
+import threading
+import time
+from collections import OrderedDict
+from itertools import chain, islice
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import TYPE_CHECKING, List, Dict, Any, Iterable, Iterator, NamedTuple, Optional, Tuple
+from datetime import datetime, timezone
 
-from ..config import WeaviateConfig
+from ..config import WeaviateConfig, SETTINGS
 from ..models import RecipeDocument
 from .weaviate_manager import WeaviateManager
+from .semantic_cache import SemanticCache
 
 logger = logging.getLogger(__name__)
 
-# Try to import weaviate with graceful fallback
-try:
-    import weaviate
+if TYPE_CHECKING:
+    from weaviate.classes.config import ConsistencyLevel
     from weaviate.classes.query import MetadataQuery
-    WEAVIATE_AVAILABLE = True
-except ImportError:
-    weaviate = None
-    MetadataQuery = None
-    WEAVIATE_AVAILABLE = False
+    from weaviate.collections.classes.batch import BatchObjectReturn
+
+# weaviate and openai are heavy imports (grpc, httpx, pydantic), so only their
+# availability is checked here; the modules are imported where they are used
+WEAVIATE_AVAILABLE = importlib.util.find_spec("weaviate") is not None
+
+# Optional: embed queries client-side so repeated queries skip the server-side
+# vectorizer; used only when SETTINGS.QUERY_EMBEDDING_CLIENT_SIDE is on
+OPENAI_AVAILABLE = importlib.util.find_spec("openai") is not None
+
+# Shared by every search; MetadataQuery is immutable so one instance suffices
+_DEFAULT_METADATA = None
+
+# Failures a database call can hit at runtime; anything else is a bug and propagates
+_DATABASE_ERRORS = None
+
+
+def _default_metadata() -> "MetadataQuery":
+    """Build the shared default search metadata on first use."""
+    global _DEFAULT_METADATA
+    if _DEFAULT_METADATA is None:
+        from weaviate.classes.query import MetadataQuery
+        _DEFAULT_METADATA = MetadataQuery(score=True, distance=True)
+    return _DEFAULT_METADATA
+
+
+def _database_errors() -> Tuple[type, ...]:
+    """Exception types handled as database failures, resolved on first use."""
+    global _DATABASE_ERRORS
+    if _DATABASE_ERRORS is None:
+        errors: Tuple[type, ...] = (ConnectionError, TimeoutError)
+        if WEAVIATE_AVAILABLE:
+            from weaviate.exceptions import WeaviateBaseError
+            errors += (WeaviateBaseError,)
+        _DATABASE_ERRORS = errors
+    return _DATABASE_ERRORS
+
+
+# Failures worth retrying, resolved on first use; status codes checked separately
+_TRANSIENT_ERRORS = None
+
+# Backoff between insert retries: doubles from the initial delay up to the cap
+_RETRY_INITIAL_DELAY = 0.2
+_RETRY_MAX_DELAY = 5.0
+
+
+def _is_transient_error(error: BaseException) -> bool:
+    """Whether a failed request may succeed on retry: connection errors, timeouts, 429 and 5xx."""
+    global _TRANSIENT_ERRORS
+    if _TRANSIENT_ERRORS is None:
+        errors: Tuple[type, ...] = (ConnectionError, TimeoutError)
+        if WEAVIATE_AVAILABLE:
+            from weaviate.exceptions import (
+                WeaviateConnectionError,
+                WeaviateGRPCUnavailableError,
+                WeaviateTimeoutError,
+            )
+            errors += (WeaviateConnectionError, WeaviateGRPCUnavailableError, WeaviateTimeoutError)
+        _TRANSIENT_ERRORS = errors
+    if isinstance(error, _TRANSIENT_ERRORS):
+        return True
+    # UnexpectedStatusCodeError carries the HTTP status; other client errors are fatal
+    status_code = getattr(error, "status_code", None)
+    return isinstance(status_code, int) and (status_code == 429 or status_code >= 500)
+
+
+def _retry_delay(attempt: int) -> float:
+    """Exponential backoff with jitter, so concurrent retries do not arrive together."""
+    return min(_RETRY_MAX_DELAY, _RETRY_INITIAL_DELAY * 2 ** attempt) + random.uniform(0, _RETRY_INITIAL_DELAY)
+
+
+def _recipe_uuid_key(recipe: RecipeDocument) -> str:
+    """
+    Identifier the batch inserts derive a recipe's object UUID from.
+    
+    Source and title together identify a recipe, so re-importing it
+    overwrites the stored copy, while same-named recipes from different
+    sources (e.g. two "Tomatensauce" recipes) are kept apart.
+    """
+    return f"{recipe.source}\n{recipe.title}"
+
+
+class NotConnectedError(RuntimeError):
+    """Raised when an operation needs a database connection that is not open."""
+
+
+class RecipeHit(NamedTuple):
+    """
+    A recipe returned by a search or scan.
+    
+    The UUID is kept as returned by the client and only formatted as a
+    string by as_dict(), so building a page of results allocates one small
+    tuple per recipe.
+    """
+    
+    uuid: Any
+    properties: Dict[str, Any]
+    metadata: Any = None
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the result as a dict with a string UUID."""
+        return {"uuid": str(self.uuid), "properties": self.properties, "metadata": self.metadata}
+
+
+# Per-process database used by add_recipes_parallel workers
+_worker_db = None
+
+
+def _init_parallel_worker(config: WeaviateConfig):
+    """Open a dedicated client in each worker process; clients are not fork-safe."""
+    global _worker_db
+    _worker_db = RecipeVectorDatabase(config)
+    _worker_db.connect()
+
+
+def _add_recipes_shard(recipes: List[RecipeDocument]) -> Dict[str, Any]:
+    """Insert one shard of recipes using the worker's own client."""
+    return _worker_db.add_recipes_batch(recipes)
 
 
 class RecipeVectorDatabase:
@@ -40,6 +163,13 @@ class RecipeVectorDatabase:
         self.manager = WeaviateManager(self.config)
         self.client = None
         self._collection = None
+        self._async_collection = None
+        self._batch_tuned = False
+        self._count_cache: Optional[Tuple[float, int]] = None
+        self._search_cache = SemanticCache()
+        self._openai = None
+        self._embed_cache: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._embed_lock = threading.Lock()
     
     def __enter__(self):
         """Context manager entry."""
@@ -47,9 +177,18 @@ class RecipeVectorDatabase:
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """Context manager exit."""
+        """Context manager exit; the client reference is released, the pooled connection stays open for reuse."""
         self.disconnect()
     
+    async def __aenter__(self):
+        """Async context manager entry."""
+        await self.aconnect()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit; the async client is tied to the running loop, so it is closed."""
+        await self.adisconnect()
+    
     def connect(self) -> bool:
         """
         Connect to the Weaviate database.
@@ -69,6 +208,23 @@ class RecipeVectorDatabase:
         self.client = None
         self._collection = None
     
+    async def aconnect(self) -> bool:
+        """
+        Connect the async client to the Weaviate database.
+        
+        Returns:
+            bool: True if connection successful
+        """
+        if await self.manager.aconnect():
+            self._async_collection = self.manager.async_client.collections.get(self.config.recipe_class_name)
+            return True
+        return False
+    
+    async def adisconnect(self):
+        """Disconnect the async client from the database."""
+        await self.manager.adisconnect()
+        self._async_collection = None
+    
     def add_recipe(self, recipe: RecipeDocument) -> Optional[str]:
         """
         Add a single recipe to the database.
@@ -79,192 +235,655 @@ class RecipeVectorDatabase:
         Returns:
             str: UUID of the added recipe, None if failed
         """
+        if self._collection is None:
+            logger.error("Failed to add recipe '%s': not connected to database", recipe.title)
+            return None
+        
         try:
-            if self._collection is None:
-                raise Exception("Not connected to database")
-            
             recipe_data = recipe.to_dict()
             uuid = self._collection.data.insert(recipe_data)
+            self._invalidate_caches()
             
-            logger.info(f"Added recipe '{recipe.title}' with UUID: {uuid}")
+            logger.info("Added recipe '%s' with UUID: %s", recipe.title, uuid)
             return str(uuid)
             
-        except Exception as e:
-            logger.error(f"Failed to add recipe '{recipe.title}': {e}")
+        except _database_errors() as e:
+            logger.error("Failed to add recipe '%s': %s", recipe.title, e)
             return None
     
-    def add_recipes_batch(self, recipes: List[RecipeDocument]) -> Dict[str, Any]:
+    def add_recipes_batch(
+        self,
+        recipes: Iterable[RecipeDocument],
+        consistency_level: Optional["ConsistencyLevel"] = None,
+        autotune: Optional[bool] = None
+    ) -> Dict[str, Any]:
         """
         Add multiple recipes to the database in batch.
         
+        Recipes are consumed one at a time, so a generator can stream an
+        arbitrarily large import without holding it in memory. Object UUIDs
+        are derived from the recipe's source and title, so re-running an
+        import overwrites existing recipes instead of duplicating them.
+        
         Args:
-            recipes: List of recipe documents to add
+            recipes: Recipe documents to add (any iterable)
+            consistency_level: Replication consistency for the writes,
+                e.g. ConsistencyLevel.QUORUM; server default if None
+            autotune: Benchmark batch sizes on the first recipes before
+                inserting (default: SETTINGS.WEAVIATE_AUTOTUNE); runs once
+                per instance and reuses earlier results for this cluster
             
         Returns:
             Dict with success count and any errors
         """
+        if self._collection is None:
+            logger.error("Failed to add recipe batch: not connected to database")
+            return {"successful": 0, "total": 0, "errors": ["Not connected to database"]}
+        
+        total = 0
         try:
-            if self._collection is None:
-                raise Exception("Not connected to database")
-            
-            # Prepare batch data
-            batch_data = [recipe.to_dict() for recipe in recipes]
+            recipes = iter(recipes)
+            if autotune is None:
+                autotune = SETTINGS.WEAVIATE_AUTOTUNE
+            if autotune and not self._batch_tuned:
+                # Sample one full batch at the largest candidate size
+                sample = list(islice(recipes, 256))
+                self.manager.autotune_batch(sample)
+                self._batch_tuned = True
+                recipes = chain(sample, recipes)
+            
+            collection = self._collection
+            if consistency_level is not None:
+                collection = collection.with_consistency_level(consistency_level)
+            
+            # Stream objects through the client-side batcher, which splits them
+            # into sub-batches and sends them concurrently over gRPC. A batch
+            # size of 0 lets the client size batches from server backpressure.
+            if self.config.batch_size > 0:
+                batcher = collection.batch.fixed_size(
+                    batch_size=self.config.batch_size,
+                    concurrent_requests=self.config.concurrent_requests
+                )
+            else:
+                batcher = collection.batch.dynamic()
             
-            # Insert batch
-            response = self._collection.data.insert_many(batch_data)
+            from weaviate.util import generate_uuid5
             
-            successful = 0
-            errors = []
+            with batcher as batch:
+                now = datetime.now(timezone.utc).isoformat()
+                for recipe in recipes:
+                    batch.add_object(
+                        properties=recipe.to_dict(now),
+                        uuid=generate_uuid5(_recipe_uuid_key(recipe))
+                    )
+                    total += 1
             
-            # Process response
-            if hasattr(response, 'uuids'):
-                successful = len(response.uuids)
-            if hasattr(response, 'errors'):
-                errors = response.errors
+            errors = [failed.message for failed in collection.batch.failed_objects]
+            successful = total - len(errors)
+            self._invalidate_caches()
             
-            logger.info(f"Batch insert: {successful} successful, {len(errors)} errors")
+            logger.info("Batch insert: %s successful, %s errors", successful, len(errors))
             
             return {
                 "successful": successful,
-                "total": len(recipes),
+                "total": total,
                 "errors": errors
             }
             
+        except _database_errors() as e:
+            logger.error("Failed to add recipe batch: %s", e)
+            return {"successful": 0, "total": total, "errors": [str(e)]}
+    
+    def add_recipes_parallel(
+        self,
+        recipes: List[RecipeDocument],
+        num_workers: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Add a large number of recipes using several worker processes.
+        
+        The recipes are split into one shard per worker and each worker runs
+        add_recipes_batch on its shard over its own gRPC client, so the
+        ingest is not limited by a single client connection. Workers are
+        started with the spawn method and connect once each.
+        
+        Args:
+            recipes: List of recipe documents to add
+            num_workers: Number of worker processes (default: min(8, CPU count))
+            
+        Returns:
+            Dict with success count and any errors, aggregated over all workers
+        """
+        if not recipes:
+            return {"successful": 0, "total": 0, "errors": []}
+        
+        num_workers = min(num_workers or min(8, os.cpu_count() or 1), len(recipes))
+        shards = [recipes[i::num_workers] for i in range(num_workers)]
+        
+        try:
+            with ProcessPoolExecutor(
+                max_workers=num_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_parallel_worker,
+                initargs=(self.config,)
+            ) as executor:
+                results = list(executor.map(_add_recipes_shard, shards))
         except Exception as e:
-            logger.error(f"Failed to add recipe batch: {e}")
+            logger.error("Failed to add recipes in parallel: %s", e)
             return {"successful": 0, "total": len(recipes), "errors": [str(e)]}
+        
+        self._invalidate_caches()
+        
+        return {
+            "successful": sum(result["successful"] for result in results),
+            "total": sum(result["total"] for result in results),
+            "errors": [error for result in results for error in result["errors"]]
+        }
+    
+    def _client_embedding_enabled(self) -> bool:
+        """Whether searches embed queries client-side (opt-in, needs openai and an API key)."""
+        return (
+            SETTINGS.QUERY_EMBEDDING_CLIENT_SIDE
+            and OPENAI_AVAILABLE
+            and bool(self.config.openai_api_key)
+            and SETTINGS.QUERY_EMBEDDING_CACHE_SIZE > 0
+        )
+    
+    def _embed_query(self, query: str) -> Optional[List[float]]:
+        """
+        Embed a query with the collection's OpenAI model, reusing earlier results.
+        
+        Returns None when client-side embedding is not enabled (see
+        _client_embedding_enabled) or the API call fails, in which case the
+        caller falls back to server-side vectorization.
+        """
+        if not self._client_embedding_enabled():
+            return None
+        
+        with self._embed_lock:
+            vector = self._embed_cache.get(query)
+            if vector is not None:
+                self._embed_cache.move_to_end(query)
+                return vector
+        
+        from openai import OpenAI, OpenAIError
+        
+        if self._openai is None:
+            self._openai = OpenAI(api_key=self.config.openai_api_key)
+        try:
+            response = self._openai.embeddings.create(
+                model=SETTINGS.DEFAULT_EMBEDDING_MODEL,
+                input=query
+            )
+        except OpenAIError as e:
+            logger.warning("Client-side query embedding failed, using server-side vectorizer: %s", e)
+            return None
+        
+        vector = response.data[0].embedding
+        with self._embed_lock:
+            self._embed_cache[query] = vector
+            if len(self._embed_cache) > SETTINGS.QUERY_EMBEDDING_CACHE_SIZE:
+                self._embed_cache.popitem(last=False)
+        return vector
     
     def search_recipes(
         self, 
         query: str, 
         limit: int = 10, 
-        certainty: float = 0.7
-    ) -> List[Dict[str, Any]]:
+        certainty: float = 0.7,
+        return_metadata: Optional["MetadataQuery"] = None,
+        cache: bool = True,
+        fields: Optional[List[str]] = None
+    ) -> List[RecipeHit]:
         """
         Search for recipes using vector similarity.
         
+        Results are cached in-process by exact query string and, when
+        fastembed is installed, reused for queries whose local embedding is
+        nearly identical to an earlier one, skipping the round-trip to
+        Weaviate. Writes clear the cache.
+        
+        With SETTINGS.QUERY_EMBEDDING_CLIENT_SIDE on, the query is embedded
+        client-side with DEFAULT_EMBEDDING_MODEL once and searched with
+        near_vector, so retries and variants with another limit or certainty
+        do not re-run the vectorizer. The embedding cache survives writes.
+        
         Args:
             query: Search query text
             limit: Maximum number of results
             certainty: Minimum similarity score (0.0 to 1.0)
+            return_metadata: Metadata to return instead of score and distance
+            cache: Whether to use the search result cache
+            fields: Properties to return, e.g. ["title"]; all properties if None
             
         Returns:
-            List of recipe documents with similarity scores
+            List of recipe hits with similarity scores
         """
+        if self._collection is None:
+            logger.error("Failed to search recipes: not connected to database")
+            return []
+        
         try:
-            if self._collection is None:
-                raise Exception("Not connected to database")
-            
-            if not WEAVIATE_AVAILABLE:
-                raise ImportError("weaviate package is required for search operations")
+            use_cache = cache and return_metadata is None
+            use_semantic = use_cache and self._search_cache.enabled
+            if use_cache:
+                cache_key = (limit, certainty, tuple(fields) if fields is not None else None)
+                cached = self._search_cache.get_exact(query, cache_key)
+                if cached is not None:
+                    logger.debug("Exact cache hit for '%s'", query)
+                    return cached
+            if use_semantic:
+                query_vector = self._search_cache.embed(query)
+                cached = self._search_cache.get(query_vector, cache_key)
+                if cached is not None:
+                    logger.debug("Semantic cache hit for '%s'", query)
+                    self._search_cache.put_exact(query, cache_key, cached)
+                    return cached
             
             # Perform vector search using v4 API
-            response = self._collection.query.near_text(
-                query=query,
-                limit=limit,
-                certainty=certainty,
-                return_metadata=MetadataQuery(score=True, distance=True)
-            )
+            embedding = self._embed_query(query)
+            if embedding is not None:
+                response = self._collection.query.near_vector(
+                    near_vector=embedding,
+                    limit=limit,
+                    certainty=certainty,
+                    return_metadata=return_metadata or _default_metadata(),
+                    return_properties=fields
+                )
+            else:
+                response = self._collection.query.near_text(
+                    query=query,
+                    limit=limit,
+                    certainty=certainty,
+                    return_metadata=return_metadata or _default_metadata(),
+                    return_properties=fields
+                )
+            
+            results = [RecipeHit(obj.uuid, obj.properties, obj.metadata) for obj in response.objects]
+            
+            if use_cache:
+                self._search_cache.put_exact(query, cache_key, results)
+            if use_semantic:
+                self._search_cache.put(query_vector, cache_key, results)
+            
+            logger.info("Vector search for '%s' returned %s results", query, len(results))
+            return results
+            
+        except _database_errors() as e:
+            logger.error("Failed to search recipes: %s", e)
+            return []
+    
+    async def aadd_recipes_batch(
+        self,
+        recipes: Iterable[RecipeDocument],
+        inflight: int = 8
+    ) -> Dict[str, Any]:
+        """
+        Add multiple recipes to the database in batch using the async client.
+        
+        Recipes are split into chunks of the configured batch size and up to
+        inflight insert_many calls are kept running at once, so the server
+        embeds one chunk while the next ones are already on the wire. The
+        recipes iterable is read in a worker thread, so a lazily parsing
+        generator keeps parsing while earlier chunks are being inserted.
+        
+        A chunk whose request fails with a connection error, timeout or
+        server error is sent again with exponential backoff, up to
+        SETTINGS.WEAVIATE_BATCH_RETRIES times; other errors fail the chunk
+        right away. UUIDs are derived from source and title, as in
+        add_recipes_batch, so a retried chunk never duplicates recipes.
+        
+        Args:
+            recipes: Recipe documents to add (any iterable)
+            inflight: Maximum number of concurrent insert requests
+            
+        Returns:
+            Dict with success count and any errors
+        """
+        if self._async_collection is None:
+            logger.error("Failed to add recipe batch: not connected to database")
+            return {"successful": 0, "total": 0, "errors": ["Not connected to database"]}
+        
+        chunk_size = self.config.batch_size if self.config.batch_size > 0 else 100
+        semaphore = asyncio.Semaphore(inflight)
+        now = datetime.now(timezone.utc).isoformat()
+        
+        # A negative setting would skip the request entirely
+        retries = max(0, SETTINGS.WEAVIATE_BATCH_RETRIES)
+        
+        from weaviate.classes.data import DataObject
+        from weaviate.util import generate_uuid5
+        
+        async def insert_chunk(chunk: List[RecipeDocument]) -> "BatchObjectReturn":
+            # The slot is held while backing off, which slows reading under server pressure
+            try:
+                objects = [
+                    DataObject(properties=recipe.to_dict(now), uuid=generate_uuid5(_recipe_uuid_key(recipe)))
+                    for recipe in chunk
+                ]
+                for attempt in range(retries + 1):
+                    try:
+                        return await self._async_collection.data.insert_many(objects)
+                    except _database_errors() as e:
+                        if attempt == retries or not _is_transient_error(e):
+                            raise
+                        delay = _retry_delay(attempt)
+                        logger.warning("Insert of %d recipes failed, retrying in %.1fs: %s", len(chunk), delay, e)
+                        await asyncio.sleep(delay)
+            finally:
+                semaphore.release()
+        
+        def read_chunk() -> List[RecipeDocument]:
+            return list(islice(recipes, chunk_size))
+        
+        # A slot is acquired before each chunk is read, so parsing never runs more
+        # than inflight chunks ahead of the inserts. Chunks are read in a worker
+        # thread: the iterator may be a parsing generator, and running it on the
+        # event loop would stall the inserts already in flight.
+        tasks = []
+        chunk_sizes = []
+        recipes = iter(recipes)
+        try:
+            while True:
+                await semaphore.acquire()
+                try:
+                    chunk = await asyncio.to_thread(read_chunk)
+                except BaseException:
+                    semaphore.release()
+                    raise
+                if not chunk:
+                    semaphore.release()
+                    break
+                tasks.append(asyncio.ensure_future(insert_chunk(chunk)))
+                chunk_sizes.append(len(chunk))
+            
+            responses = await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            # If reading failed or was cancelled, stop the inserts already scheduled
+            pending = [task for task in tasks if not task.done()]
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        
+        successful = 0
+        errors = []
+        for response in responses:
+            if isinstance(response, _database_errors()):
+                logger.error("Failed to add recipe batch: %s", response)
+                errors.append(str(response))
+            elif isinstance(response, BaseException):
+                raise response
+            else:
+                successful += len(response.uuids)
+                if response.has_errors:
+                    errors.extend(error.message for error in response.errors.values())
+        
+        if successful:
+            self._invalidate_caches()
+        
+        total = sum(chunk_sizes)
+        logger.info("Async batch insert: %s successful, %s failed", successful, total - successful)
+        
+        return {
+            "successful": successful,
+            "total": total,
+            "errors": errors
+        }
+    
+    async def asearch_recipes(
+        self,
+        query: str,
+        limit: int = 10,
+        certainty: float = 0.7,
+        return_metadata: Optional["MetadataQuery"] = None,
+        fields: Optional[List[str]] = None
+    ) -> List[RecipeHit]:
+        """
+        Search for recipes using vector similarity with the async client.
+        
+        Concurrent searches can be run with asyncio.gather and share the
+        async client's single HTTP/2 connection. Queries are vectorized the
+        same way as in search_recipes, so both rank results identically.
+        
+        Args:
+            query: Search query text
+            limit: Maximum number of results
+            certainty: Minimum similarity score (0.0 to 1.0)
+            return_metadata: Metadata to return instead of score and distance
+            fields: Properties to return, e.g. ["title"]; all properties if None
+            
+        Returns:
+            List of recipe hits with similarity scores
+        """
+        if self._async_collection is None:
+            logger.error("Failed to search recipes: not connected to database")
+            return []
+        
+        try:
+            embedding = None
+            if self._client_embedding_enabled():
+                # The OpenAI call is blocking, so it runs in a worker thread
+                embedding = await asyncio.to_thread(self._embed_query, query)
+            if embedding is not None:
+                response = await self._async_collection.query.near_vector(
+                    near_vector=embedding,
+                    limit=limit,
+                    certainty=certainty,
+                    return_metadata=return_metadata or _default_metadata(),
+                    return_properties=fields
+                )
+            else:
+                response = await self._async_collection.query.near_text(
+                    query=query,
+                    limit=limit,
+                    certainty=certainty,
+                    return_metadata=return_metadata or _default_metadata(),
+                    return_properties=fields
+                )
             
-            results = []
-            for obj in response.objects:
-                result = {
-                    "uuid": str(obj.uuid),
-                    "properties": obj.properties,
-                    "metadata": obj.metadata
-                }
-                results.append(result)
+            results = [RecipeHit(obj.uuid, obj.properties, obj.metadata) for obj in response.objects]
             
-            logger.info(f"Vector search for '{query}' returned {len(results)} results")
+            logger.info("Async vector search for '%s' returned %s results", query, len(results))
             return results
             
-        except Exception as e:
-            logger.error(f"Failed to search recipes: {e}")
+        except _database_errors() as e:
+            logger.error("Failed to search recipes: %s", e)
             return []
     
-    def get_recipe_by_id(self, uuid: str) -> Optional[Dict[str, Any]]:
+    def search_recipes_batch(
+        self,
+        queries: List[str],
+        limit: int = 10,
+        certainty: float = 0.7
+    ) -> List[List[RecipeHit]]:
+        """
+        Run several vector searches concurrently over the shared client.
+        
+        Useful for RAG fan-out where one user turn produces multiple query
+        reformulations; the v4 client is thread-safe, so the searches share
+        one connection instead of running back to back.
+        
+        Args:
+            queries: Search query texts
+            limit: Maximum number of results per query
+            certainty: Minimum similarity score (0.0 to 1.0)
+            
+        Returns:
+            One result list per query, in the same order as queries
+        """
+        if not queries:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=min(8, len(queries))) as executor:
+            return list(executor.map(
+                lambda query: self.search_recipes(query, limit=limit, certainty=certainty),
+                queries
+            ))
+    
+    def get_recipe_by_id(self, uuid: str, fields: Optional[List[str]] = None) -> Optional[RecipeHit]:
         """
         Get a specific recipe by its UUID.
         
         Args:
             uuid: Recipe UUID
+            fields: Properties to return, e.g. ["title"]; all properties if None
             
         Returns:
-            Recipe document or None if not found
+            RecipeHit, or None if not found
         """
+        if self._collection is None:
+            logger.error("Failed to get recipe by ID %s: not connected to database", uuid)
+            return None
+        
         try:
-            if self._collection is None:
-                raise Exception("Not connected to database")
-            
-            obj = self._collection.query.fetch_object_by_id(uuid)
+            obj = self._collection.query.fetch_object_by_id(uuid, return_properties=fields)
             
             if obj:
-                return {
-                    "uuid": str(obj.uuid),
-                    "properties": obj.properties
-                }
+                return RecipeHit(obj.uuid, obj.properties, obj.metadata)
             
             return None
             
-        except Exception as e:
-            logger.error(f"Failed to get recipe by ID {uuid}: {e}")
+        except _database_errors() as e:
+            logger.error("Failed to get recipe by ID %s: %s", uuid, e)
             return None
     
+    def get_recipes_by_ids(self, uuids: List[str]) -> Dict[str, RecipeHit]:
+        """
+        Get several recipes by UUID in a single query.
+        
+        Args:
+            uuids: Recipe UUIDs
+            
+        Returns:
+            Dict mapping UUID string to RecipeHit; missing UUIDs are left out
+        """
+        if not uuids:
+            return {}
+        
+        if self._collection is None:
+            logger.error("Failed to get %s recipes by ID: not connected to database", len(uuids))
+            return {}
+        
+        try:
+            from weaviate.classes.query import Filter
+            
+            response = self._collection.query.fetch_objects(
+                filters=Filter.by_id().contains_any(uuids),
+                limit=len(uuids)
+            )
+            
+            return {
+                str(obj.uuid): RecipeHit(obj.uuid, obj.properties, obj.metadata)
+                for obj in response.objects
+            }
+            
+        except _database_errors() as e:
+            logger.error("Failed to get %s recipes by ID: %s", len(uuids), e)
+            return {}
+    
+    def _invalidate_caches(self):
+        """Drop cached recipe counts and search results after a write."""
+        self._count_cache = None
+        self.manager.invalidate_count_cache()
+        self._search_cache.clear()
+    
     def count_recipes(self) -> int:
         """
         Count the total number of recipes in the database.
         
+        The result is cached for SETTINGS.COUNT_CACHE_TTL seconds and
+        invalidated by writes made through this instance.
+        
         Returns:
             int: Number of recipes
         """
+        if self._collection is None:
+            logger.error("Failed to count recipes: not connected to database")
+            return 0
+        
         try:
-            if self._collection is None:
-                raise Exception("Not connected to database")
+            if self._count_cache and time.monotonic() - self._count_cache[0] < SETTINGS.COUNT_CACHE_TTL:
+                return self._count_cache[1]
             
             # Use aggregate query to count objects in v4 API
             count_result = self._collection.aggregate.over_all(total_count=True)
             count = count_result.total_count if count_result.total_count else 0
             
+            self._count_cache = (time.monotonic(), count)
             return count
             
-        except Exception as e:
-            logger.error(f"Failed to count recipes: {e}")
+        except _database_errors() as e:
+            logger.error("Failed to count recipes: %s", e)
             return 0
     
-    def get_all_recipes(self, limit: int = 100, offset: int = 0) -> List[Dict[str, Any]]:
+    def iter_recipes(self, batch: int = 500, fields: Optional[List[str]] = None) -> Iterator[RecipeHit]:
+        """
+        Stream all recipes from the database.
+        
+        Uses the server-side cursor, so the collection is walked page by page
+        without offset paging and only one page is held in memory at a time.
+        
+        Args:
+            batch: Number of recipes fetched per round-trip
+            fields: Properties to return, e.g. ["title"]; all properties if None
+            
+        Yields:
+            Recipe hits
+            
+        Raises:
+            NotConnectedError: If the database is not connected
+            WeaviateBaseError: If a page cannot be fetched; the scan is not
+                silently cut short, so callers never see a partial export
+        """
+        if self._collection is None:
+            raise NotConnectedError("Not connected to database")
+        
+        for obj in self._collection.iterator(
+            include_vector=False,
+            return_properties=fields,
+            cache_size=batch
+        ):
+            yield RecipeHit(obj.uuid, obj.properties, obj.metadata)
+    
+    def get_all_recipes(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        fields: Optional[List[str]] = None
+    ) -> List[RecipeHit]:
         """
         Get all recipes from the database.
         
+        For exports or full scans prefer iter_recipes(), which streams the
+        whole collection without materializing it.
+        
         Args:
             limit: Maximum number of recipes to return
             offset: Number of recipes to skip
+            fields: Properties to return, e.g. ["title"]; all properties if None
             
         Returns:
-            List of recipe documents
+            List of recipe hits
         """
+        if self._collection is None:
+            logger.error("Failed to get recipes: not connected to database")
+            return []
+        
         try:
-            if self._collection is None:
-                raise Exception("Not connected to database")
-            
             response = self._collection.query.fetch_objects(
                 limit=limit,
-                offset=offset
+                offset=offset,
+                return_properties=fields
             )
-            
-            results = []
-            for obj in response.objects:
-                result = {
-                    "uuid": str(obj.uuid),
-                    "properties": obj.properties
-                }
-                results.append(result)
-            
-            logger.info(f"Retrieved {len(results)} recipes (limit: {limit}, offset: {offset})")
-            return results
-            
-        except Exception as e:
-            logger.error(f"Failed to get all recipes: {e}")
+        except _database_errors() as e:
+            logger.error("Failed to get all recipes: %s", e)
             return []
+        
+        results = [RecipeHit(obj.uuid, obj.properties, obj.metadata) for obj in response.objects]
+        
+        logger.info("Retrieved %s recipes (limit: %s, offset: %s)", len(results), limit, offset)
+        return results
     
     def delete_recipe(self, uuid: str) -> bool:
         """
@@ -276,50 +895,73 @@ class RecipeVectorDatabase:
         Returns:
             bool: True if deleted successfully
         """
+        if self._collection is None:
+            logger.error("Failed to delete recipe %s: not connected to database", uuid)
+            return False
+        
         try:
-            if self._collection is None:
-                raise Exception("Not connected to database")
-            
             success = self._collection.data.delete_by_id(uuid)
+            self._invalidate_caches()
             
             if success:
-                logger.info(f"Deleted recipe with UUID: {uuid}")
+                logger.info("Deleted recipe with UUID: %s", uuid)
             else:
-                logger.warning(f"Recipe with UUID {uuid} not found for deletion")
+                logger.warning("Recipe with UUID %s not found for deletion", uuid)
             
             return success
             
-        except Exception as e:
-            logger.error(f"Failed to delete recipe {uuid}: {e}")
+        except _database_errors() as e:
+            logger.error("Failed to delete recipe %s: %s", uuid, e)
             return False
     
-    def update_recipe(self, uuid: str, recipe: RecipeDocument) -> bool:
+    def update_recipe(
+        self,
+        uuid: str,
+        recipe: Optional[RecipeDocument] = None,
+        *,
+        partial: Optional[Dict[str, Any]] = None
+    ) -> bool:
         """
         Update a recipe by its UUID.
         
+        Either pass a full recipe document or a partial dict holding only the
+        changed properties. The update is sent as a PATCH, so with a partial
+        dict untouched properties are left as they are and the server does
+        not need to re-embed text that did not change.
+        
         Args:
             uuid: Recipe UUID to update
             recipe: Updated recipe document
+            partial: Only the properties to change
             
         Returns:
             bool: True if updated successfully
+            
+        Raises:
+            ValueError: If neither recipe nor partial is given
         """
+        if recipe is None and partial is None:
+            raise ValueError("Either recipe or partial must be provided")
+        
+        if self._collection is None:
+            logger.error("Failed to update recipe %s: not connected to database", uuid)
+            return False
+        
         try:
-            if self._collection is None:
-                raise Exception("Not connected to database")
-            
-            recipe_data = recipe.to_dict()
-            recipe_data["updated_at"] = datetime.now()
-            
-            success = self._collection.data.update(uuid, recipe_data)
-            
-            if success:
-                logger.info(f"Updated recipe '{recipe.title}' with UUID: {uuid}")
+            now = datetime.now(timezone.utc).replace(microsecond=0).isoformat()
+            if partial is not None:
+                recipe_data = dict(partial)
+                recipe_data["updated_at"] = now
             else:
-                logger.warning(f"Recipe with UUID {uuid} not found for update")
+                recipe_data = recipe.to_update_dict(now)
             
-            return success
+            # Raises if the object does not exist or the update is rejected
+            self._collection.data.update(uuid, properties=recipe_data)
+            self._invalidate_caches()
             
-        except Exception as e:
-            logger.error(f"Failed to update recipe {uuid}: {e}")
+            logger.info("Updated recipe with UUID: %s", uuid)
+            return True
+            
+        except _database_errors() as e:
+            logger.error("Failed to update recipe %s: %s", uuid, e)
             return False
@@ -0,0 +1,231 @@
+"""
+Semantic Search Cache
+
+This module provides an in-process cache that reuses vector search results
+for near-duplicate queries ("Italian pasta", "pasta italian") by comparing
+small local sentence embeddings instead of the raw query text.
+"""
+
+import importlib.util
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Hashable, List, Optional, Tuple
+
+from ..config import SETTINGS
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from .recipe_vector_database import RecipeHit
+
+# numpy and fastembed are optional and imported on first use, not at startup
+SEMANTIC_CACHE_AVAILABLE = (
+    importlib.util.find_spec("numpy") is not None
+    and importlib.util.find_spec("fastembed") is not None
+)
+
+
+def _copy_results(results: List["RecipeHit"]) -> List["RecipeHit"]:
+    """
+    Copy cached search hits, so a caller that mutates one cannot corrupt later hits.
+    
+    The properties dict and its list values (e.g. tags) are copied; strings,
+    UUIDs and metadata are immutable in practice and shared.
+    """
+    return [
+        hit._replace(properties={
+            name: list(value) if isinstance(value, list) else value
+            for name, value in hit.properties.items()
+        })
+        for hit in results
+    ]
+
+
+class SemanticCache:
+    """
+    Two-tier LRU cache of search results.
+
+    The exact tier maps the literal query string to its results and needs no
+    optional dependencies. The semantic tier keeps L2-normalized query
+    embeddings in one preallocated matrix, so a lookup is a single
+    matrix-vector product over all entries.
+    """
+
+    def __init__(
+        self,
+        max_size: int = SETTINGS.SEMANTIC_CACHE_SIZE,
+        exact_size: int = SETTINGS.EXACT_CACHE_SIZE,
+        threshold: float = SETTINGS.SEMANTIC_CACHE_THRESHOLD,
+        ttl: float = SETTINGS.SEMANTIC_CACHE_TTL,
+        model_name: str = SETTINGS.SEMANTIC_CACHE_MODEL
+    ):
+        """
+        Initialize the semantic cache.
+
+        Args:
+            max_size: Maximum number of queries in the semantic tier
+            exact_size: Maximum number of queries in the exact tier
+            threshold: Minimum cosine similarity to reuse cached results
+            ttl: Seconds a cached entry stays valid
+            model_name: fastembed model used to embed queries
+        """
+        self.max_size = max_size
+        self.exact_size = exact_size
+        self.threshold = threshold
+        self.ttl = ttl
+        self.model_name = model_name
+        self._model = None
+        self._lock = threading.Lock()
+        # Separate from _lock so cache lookups are not blocked while the model loads
+        self._model_lock = threading.Lock()
+        self._vectors = None
+        self._stored_at = None
+        self._last_used = None
+        self._keys: List[Optional[Hashable]] = [None] * max_size
+        self._results: List[Optional[List["RecipeHit"]]] = [None] * max_size
+        self._exact: "OrderedDict[Tuple[str, Hashable], Tuple[float, List[RecipeHit]]]" = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the semantic tier is usable (optional dependencies installed)."""
+        return SEMANTIC_CACHE_AVAILABLE and self.max_size > 0
+
+    def get_exact(self, query: str, key: Hashable) -> Optional[List["RecipeHit"]]:
+        """
+        Look up results for exactly this query string.
+
+        Args:
+            query: Search query text
+            key: Remaining search parameters
+
+        Returns:
+            Cached results, or None on a miss
+        """
+        with self._lock:
+            entry = self._exact.get((query, key))
+            if entry is None:
+                return None
+            if time.monotonic() - entry[0] >= self.ttl:
+                del self._exact[(query, key)]
+                return None
+            self._exact.move_to_end((query, key))
+            return _copy_results(entry[1])
+
+    def put_exact(self, query: str, key: Hashable, results: List["RecipeHit"]):
+        """
+        Store results for this query string, evicting the least recently used entry.
+
+        Args:
+            query: Search query text
+            key: Remaining search parameters the results were produced with
+            results: Search results to cache
+        """
+        if self.exact_size <= 0:
+            return
+        results = _copy_results(results)
+        with self._lock:
+            self._exact[(query, key)] = (time.monotonic(), results)
+            self._exact.move_to_end((query, key))
+            if len(self._exact) > self.exact_size:
+                self._exact.popitem(last=False)
+
+    def embed(self, query: str) -> "np.ndarray":
+        """
+        Embed and L2-normalize a query, loading the model on first use.
+
+        Args:
+            query: Search query text
+
+        Returns:
+            Unit-length query embedding to pass to get() and put()
+        """
+        import numpy as np
+        
+        model = self._model
+        if model is None:
+            # Concurrent searches must not each load the model
+            with self._model_lock:
+                if self._model is None:
+                    self._model = self._load_model()
+                model = self._model
+        vector = np.asarray(next(iter(model.embed([query]))), dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def _load_model(self):
+        """Load the fastembed model."""
+        from fastembed import TextEmbedding
+        return TextEmbedding(model_name=self.model_name)
+
+    def get(self, vector: "np.ndarray", key: Hashable) -> Optional[List["RecipeHit"]]:
+        """
+        Look up results for a query similar to one already cached.
+
+        Args:
+            vector: Query embedding from embed()
+            key: Remaining search parameters; only entries with an equal key match
+
+        Returns:
+            Cached results, or None on a miss
+        """
+        import numpy as np
+        
+        with self._lock:
+            if self._vectors is None:
+                return None
+
+            now = time.monotonic()
+            scores = self._vectors @ vector
+            # Skip empty and expired slots and those searched with other parameters
+            valid = now - self._stored_at < self.ttl
+            for slot in np.flatnonzero(valid):
+                if self._keys[slot] != key:
+                    valid[slot] = False
+            if not valid.any():
+                return None
+
+            scores[~valid] = -1.0
+            best = int(np.argmax(scores))
+            if scores[best] < self.threshold:
+                return None
+
+            self._last_used[best] = now
+            return _copy_results(self._results[best])
+
+    def put(self, vector: "np.ndarray", key: Hashable, results: List["RecipeHit"]):
+        """
+        Store results for a query, evicting the least recently used entry when full.
+
+        Args:
+            vector: Query embedding from embed()
+            key: Remaining search parameters the results were produced with
+            results: Search results to cache
+        """
+        import numpy as np
+        
+        results = _copy_results(results)
+        with self._lock:
+            if self._vectors is None:
+                self._vectors = np.zeros((self.max_size, vector.shape[0]), dtype=np.float32)
+                self._stored_at = np.full(self.max_size, -np.inf)
+                self._last_used = np.full(self.max_size, -np.inf)
+
+            # Empty slots have last_used == -inf and are picked first
+            slot = int(np.argmin(self._last_used))
+            now = time.monotonic()
+            self._vectors[slot] = vector
+            self._stored_at[slot] = now
+            self._last_used[slot] = now
+            self._keys[slot] = key
+            self._results[slot] = results
+
+    def clear(self):
+        """Drop all cached results, e.g. after the collection changed."""
+        with self._lock:
+            if self._vectors is not None:
+                self._stored_at.fill(-float("inf"))
+                self._last_used.fill(-float("inf"))
+            self._keys = [None] * self.max_size
+            self._results = [None] * self.max_size
+            self._exact.clear()
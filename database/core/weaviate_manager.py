@@ -5,21 +5,27 @@ This module provides the manager class for Weaviate database operations
 using v4 API, including connection management and schema operations.
 """
 
+import atexit
+import importlib.util
+import json
 import logging
-from typing import Dict, Any, Optional
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Sequence, Tuple
 
-from ..config import WeaviateConfig
+from ..config import WeaviateConfig, SETTINGS
+from ..config.database_config import close_cached_clients
+from ..models import RecipeDocument
 from ..schema import RecipeSchema
 
 logger = logging.getLogger(__name__)
 
-# Try to import weaviate with graceful fallback
-try:
-    import weaviate
-    WEAVIATE_AVAILABLE = True
-except ImportError:
-    WEAVIATE_AVAILABLE = False
-    weaviate = None
+# weaviate itself is imported by WeaviateConfig when a client is created
+WEAVIATE_AVAILABLE = importlib.util.find_spec("weaviate") is not None
+
+# Where autotuned batch sizes are remembered between runs
+BATCH_TUNE_CACHE_PATH = Path.home() / ".cache" / "recipe-manager" / "batch_tune.json"
 
 
 class WeaviateManager:
@@ -34,6 +40,9 @@ class WeaviateManager:
         """
         self.config = config or WeaviateConfig()
         self.client = None
+        self.async_client = None
+        self._count_cache: Optional[Tuple[float, int]] = None
+        self._describe_cache: Optional[Tuple[float, Dict[str, Any]]] = None
     
     def connect(self) -> bool:
         """
@@ -43,7 +52,10 @@ class WeaviateManager:
             bool: True if connection successful, False otherwise
         """
         try:
-            self.client = self.config.get_client()
+            client = self.config.get_client()
+            if self.client is not None:
+                self.config.release_client(self.client)
+            self.client = client
             if self.client.is_ready():
                 logger.info("Successfully connected to Weaviate database")
                 return True
@@ -51,14 +63,60 @@ class WeaviateManager:
                 logger.error("Weaviate is not ready")
                 return False
         except Exception as e:
-            logger.error(f"Failed to connect to Weaviate: {e}")
+            logger.error("Failed to connect to Weaviate: %s", e)
             return False
     
     def disconnect(self):
-        """Disconnect from Weaviate database."""
+        """
+        Release this manager's reference to the Weaviate client.
+        
+        The underlying connection stays open in the process-wide client pool
+        so the next connect() can reuse it, unless the pool has grown past
+        WEAVIATE_POOL_SIZE; use shutdown_pool() to close all of them.
+        """
         if self.client:
-            self.client.close()
-            logger.info("Disconnected from Weaviate database")
+            self.config.release_client(self.client)
+            self.client = None
+            logger.debug("Released Weaviate client back to the pool")
+    
+    async def aconnect(self) -> bool:
+        """
+        Connect the async client to Weaviate database.
+        
+        The async client is created once per manager and reused for all
+        async operations, which are multiplexed over its connection.
+        
+        Returns:
+            bool: True if connection successful, False otherwise
+        """
+        try:
+            if self.async_client is None:
+                async_client = self.config.get_async_client()
+                await async_client.connect()
+                self.async_client = async_client
+            
+            if await self.async_client.is_ready():
+                logger.info("Successfully connected async client to Weaviate database")
+                return True
+            else:
+                logger.error("Weaviate is not ready")
+                return False
+        except Exception as e:
+            logger.error("Failed to connect async client to Weaviate: %s", e)
+            return False
+    
+    async def adisconnect(self):
+        """Close the async client."""
+        if self.async_client:
+            await self.async_client.close()
+            self.async_client = None
+            logger.info("Disconnected async client from Weaviate database")
+    
+    @classmethod
+    def shutdown_pool(cls):
+        """Close all pooled Weaviate client connections (registered to run at interpreter exit)."""
+        close_cached_clients()
+        logger.debug("Closed all pooled Weaviate connections")
     
     def create_schema(self) -> bool:
         """
@@ -73,25 +131,42 @@ class WeaviateManager:
             
             # Check if collection already exists
             if self.client.collections.exists(self.config.recipe_class_name):
-                logger.info(f"Collection {self.config.recipe_class_name} already exists")
+                logger.info("Collection %s already exists", self.config.recipe_class_name)
                 return True
             
             # Create the Recipe collection using v4 API
-            self.client.collections.create(
-                name=self.config.recipe_class_name,
-                properties=RecipeSchema.get_properties(),
-                vectorizer_config=RecipeSchema.get_vectorizer_config(),
-                vector_index_config=RecipeSchema.get_collection_config(),
-                description="Recipe collection for RAG vector database"
-            )
-            
-            logger.info(f"Created {self.config.recipe_class_name} collection in Weaviate")
+            self._create_collection(self.config.recipe_class_name)
+            self.invalidate_count_cache()
+            
+            logger.info("Created %s collection in Weaviate", self.config.recipe_class_name)
             return True
             
         except Exception as e:
-            logger.error(f"Failed to create schema: {e}")
+            logger.error("Failed to create schema: %s", e)
             return False
     
+    def _create_collection(self, name: str, vectorize: bool = True):
+        """
+        Create a collection with the recipe schema under the given name.
+        
+        Args:
+            name: Collection name
+            vectorize: Embed objects with the schema's vectorizer; without it
+                no embedding requests are made and objects have no vectors
+        """
+        if vectorize:
+            vectorizer_config = RecipeSchema.get_vectorizer_config()
+        else:
+            from weaviate.classes.config import Configure
+            vectorizer_config = Configure.Vectorizer.none()
+        return self.client.collections.create(
+            name=name,
+            properties=RecipeSchema.get_properties(),
+            vectorizer_config=vectorizer_config,
+            vector_index_config=RecipeSchema.get_collection_config(),
+            description="Recipe collection for RAG vector database"
+        )
+    
     def delete_schema(self) -> bool:
         """
         Delete the recipe collection from Weaviate.
@@ -105,16 +180,74 @@ class WeaviateManager:
             
             if self.client.collections.exists(self.config.recipe_class_name):
                 self.client.collections.delete(self.config.recipe_class_name)
-                logger.info(f"Deleted {self.config.recipe_class_name} collection from Weaviate")
+                self.invalidate_count_cache()
+                logger.info("Deleted %s collection from Weaviate", self.config.recipe_class_name)
                 return True
             else:
-                logger.info(f"Collection {self.config.recipe_class_name} does not exist")
+                logger.info("Collection %s does not exist", self.config.recipe_class_name)
                 return True
                 
         except Exception as e:
-            logger.error(f"Failed to delete schema: {e}")
+            logger.error("Failed to delete schema: %s", e)
             return False
     
+    def describe(self) -> Dict[str, Any]:
+        """
+        Describe the server and the recipe collection in as few round-trips as possible.
+        
+        Readiness is checked with is_ready() on every call. Server metadata
+        (one get_meta() call) and the recipe count (one aggregate query,
+        which fails if the collection does not exist) are cached for
+        SETTINGS.DESCRIBE_CACHE_TTL seconds so dashboards can poll cheaply,
+        but a server that stops being ready is never reported from the cache.
+        A description is only returned for a ready server, which is live too.
+        
+        Returns:
+            Dict with server metadata, collection info and object count
+            
+        Raises:
+            ConnectionError: If no client can be connected or the server is not ready
+        """
+        if not self.client and not self.connect():
+            raise ConnectionError("Cannot connect to database")
+        
+        if not self.client.is_ready():
+            self._describe_cache = None
+            raise ConnectionError(f"Weaviate at {self.config.url} is not ready")
+        
+        now = time.monotonic()
+        if self._describe_cache and now - self._describe_cache[0] < SETTINGS.DESCRIBE_CACHE_TTL:
+            return self._describe_cache[1]
+        
+        from weaviate.exceptions import WeaviateBaseError
+        
+        meta = self.client.get_meta()
+        
+        collection_name = self.config.recipe_class_name
+        try:
+            total_count = self.client.collections.get(collection_name).aggregate.over_all(total_count=True).total_count
+            count = total_count if total_count else 0
+            collection_exists = True
+            self._count_cache = (now, count)
+        except WeaviateBaseError as e:
+            logger.debug("Cannot aggregate collection %s: %s", collection_name, e)
+            count = 0
+            collection_exists = False
+        
+        description = {
+            # Checked above; a ready server is also live
+            "ready": True,
+            "live": True,
+            "version": meta.get("version", "unknown"),
+            "modules": sorted(meta.get("modules") or {}),
+            "collection_name": collection_name,
+            "collection_exists": collection_exists,
+            "count": count,
+            "url": self.config.url
+        }
+        self._describe_cache = (now, description)
+        return description
+    
     def health_check(self) -> Dict[str, Any]:
         """
         Check the health of the Weaviate database.
@@ -123,49 +256,39 @@ class WeaviateManager:
             Dict containing health status and metadata
         """
         try:
-            if not self.client:
-                self.connect()
-            
-            if not self.client:
-                return {"status": "error", "message": "Cannot connect to database"}
-            
-            # Check if Weaviate is ready
-            is_ready = self.client.is_ready()
-            is_live = self.client.is_live()
-            
-            if is_ready and is_live:
-                # Get meta information
-                meta = self.client.get_meta()
-                
-                # Check if recipe collection exists
-                collection_exists = self.client.collections.exists(self.config.recipe_class_name)
-                
-                return {
-                    "status": "healthy",
-                    "ready": True,
-                    "live": True,
-                    "version": meta.get("version", "unknown"),
-                    "weaviate_version": meta.get("version", "unknown"),
-                    "collection_exists": collection_exists,
-                    "collection_name": self.config.recipe_class_name,
-                    "url": self.config.url
-                }
-            else:
-                return {
-                    "status": "not_ready", 
-                    "ready": is_ready,
-                    "live": is_live,
-                    "message": "Weaviate is not ready"
-                }
-                
+            description = self.describe()
         except Exception as e:
-            logger.error(f"Health check failed: {e}")
-            return {"status": "error", "ready": False, "live": False, "message": str(e)}
+            logger.error("Health check failed: %s", e)
+            # A server that is starting up or shutting down can be live but not ready
+            try:
+                live = self.client is not None and self.client.is_live()
+            except Exception:
+                live = False
+            return {"status": "error", "ready": False, "live": live, "message": str(e)}
+        
+        return {
+            "status": "healthy",
+            "ready": description["ready"],
+            "live": description["live"],
+            "version": description["version"],
+            "weaviate_version": description["version"],
+            "collection_exists": description["collection_exists"],
+            "collection_name": description["collection_name"],
+            "count": description["count"],
+            "url": description["url"]
+        }
+    
+    def invalidate_count_cache(self):
+        """Drop the cached object count so the next count_objects() or describe() queries the server."""
+        self._count_cache = None
+        self._describe_cache = None
     
     def count_objects(self) -> int:
         """
         Count the number of recipe objects in the database.
         
+        The result is cached for SETTINGS.COUNT_CACHE_TTL seconds.
+        
         Returns:
             int: Number of objects, -1 if error
         """
@@ -174,8 +297,11 @@ class WeaviateManager:
                 if not self.connect():
                     raise Exception("Failed to connect to database")
             
+            if self._count_cache and time.monotonic() - self._count_cache[0] < SETTINGS.COUNT_CACHE_TTL:
+                return self._count_cache[1]
+            
             if not self.client.collections.exists(self.config.recipe_class_name):
-                logger.warning(f"Collection {self.config.recipe_class_name} does not exist")
+                logger.warning("Collection %s does not exist", self.config.recipe_class_name)
                 return 0
             
             collection = self.client.collections.get(self.config.recipe_class_name)
@@ -184,11 +310,122 @@ class WeaviateManager:
             count_result = collection.aggregate.over_all(total_count=True)
             count = count_result.total_count if count_result.total_count else 0
             
+            self._count_cache = (time.monotonic(), count)
             return count
             
         except Exception as e:
-            logger.error(f"Failed to count objects: {e}")
+            logger.error("Failed to count objects: %s", e)
             return -1
+    
+    def autotune_batch(
+        self,
+        sample_recipes: List[RecipeDocument],
+        candidate_sizes: Sequence[int] = (16, 32, 64, 128, 256)
+    ) -> int:
+        """
+        Pick the fastest batch size by timing inserts of a recipe sample.
+        
+        Each candidate size inserts the sample into a throwaway collection,
+        which is dropped afterwards, also if the benchmark fails. The
+        throwaway collection has no vectorizer, so the benchmark makes no
+        embedding requests; it measures request and indexing overhead only.
+        Sizes whose inserts report failed objects (e.g. 429s or timeouts)
+        are not considered. The winning size is written back to
+        config.batch_size and cached on disk per cluster URL, so the
+        benchmark only re-runs for a new cluster. If every size fails,
+        nothing is cached and the configured batch size is kept.
+        
+        Args:
+            sample_recipes: Recipes used for the benchmark inserts
+            candidate_sizes: Batch sizes to try
+            
+        Returns:
+            int: The selected batch size
+        """
+        cache_key = self.config.url
+        tune_cache = self._load_batch_tune_cache()
+        if cache_key in tune_cache:
+            self.config.batch_size = int(tune_cache[cache_key])
+            logger.info("Using cached batch size %s for %s", self.config.batch_size, self.config.url)
+            return self.config.batch_size
+        
+        if not sample_recipes:
+            return self.config.batch_size
+        
+        tune_collection_name = f"{self.config.recipe_class_name}_BatchTune"
+        timings = {}
+        try:
+            if not self.client and not self.connect():
+                raise Exception("Failed to connect to database")
+            
+            now = datetime.now(timezone.utc).isoformat()
+            
+            for size in candidate_sizes:
+                if self.client.collections.exists(tune_collection_name):
+                    self.client.collections.delete(tune_collection_name)
+                collection = self._create_collection(tune_collection_name, vectorize=False)
+                
+                start = time.perf_counter_ns()
+                with collection.batch.fixed_size(
+                    batch_size=size,
+                    concurrent_requests=self.config.concurrent_requests
+                ) as batch:
+                    for recipe in sample_recipes:
+                        batch.add_object(properties=recipe.to_dict(now))
+                elapsed = time.perf_counter_ns() - start
+                
+                # A size that fails fast must not win
+                failed = len(collection.batch.failed_objects)
+                if failed:
+                    logger.warning("Batch size %s: %d of %d objects failed, skipping",
+                                   size, failed, len(sample_recipes))
+                    continue
+                timings[size] = elapsed
+                logger.debug("Batch size %s: %.1f ms", size, elapsed / 1e6)
+            
+        except Exception as e:
+            logger.error("Batch size autotuning failed: %s", e)
+            return self.config.batch_size
+        finally:
+            if self.client is not None:
+                try:
+                    if self.client.collections.exists(tune_collection_name):
+                        self.client.collections.delete(tune_collection_name)
+                except Exception as e:
+                    logger.warning("Failed to delete collection %s: %s", tune_collection_name, e)
+        
+        if not timings:
+            logger.warning("Batch size autotuning failed for every size, keeping %s", self.config.batch_size)
+            return self.config.batch_size
+        
+        self.config.batch_size = min(timings, key=timings.get)
+        tune_cache[cache_key] = self.config.batch_size
+        self._save_batch_tune_cache(tune_cache)
+        
+        logger.info("Autotuned batch size: %s", self.config.batch_size)
+        return self.config.batch_size
+    
+    @staticmethod
+    def _load_batch_tune_cache() -> Dict[str, int]:
+        """Load previously tuned batch sizes from disk."""
+        try:
+            with open(BATCH_TUNE_CACHE_PATH, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    @staticmethod
+    def _save_batch_tune_cache(tune_cache: Dict[str, int]):
+        """Persist tuned batch sizes to disk."""
+        try:
+            BATCH_TUNE_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            with open(BATCH_TUNE_CACHE_PATH, 'w', encoding='utf-8') as f:
+                json.dump(tune_cache, f, indent=2)
+        except OSError as e:
+            logger.warning("Failed to write batch tune cache: %s", e)
+
+
+atexit.register(WeaviateManager.shutdown_pool)
 
 
 def setup_database(config: Optional[WeaviateConfig] = None) -> WeaviateManager:
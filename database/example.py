@@ -49,12 +49,12 @@ def main():
             
             # Search for recipes
             if uuid:  # Only search if we successfully added a recipe
-                results = db.search_recipes("Italian pasta recipes", limit=5)
+                results = db.search_recipes("Italian pasta recipes", limit=5, fields=["title"])
                 print(f"Found {len(results)} recipes")
                 
                 for result in results:
-                    title = result.get('properties', {}).get('title', 'Unknown')
-                    score = result.get('metadata', {}).get('score', 0)
+                    title = result.properties.get('title', 'Unknown')
+                    score = result.metadata.score or 0
                     print(f"  - {title} (score: {score:.3f})")
             
             # Count recipes
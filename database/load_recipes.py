@@ -7,6 +7,7 @@ into the Weaviate vector database.
 """
 
 import argparse
+import asyncio
 import logging
 import sys
 import os
@@ -23,7 +24,19 @@ def main():
     parser = argparse.ArgumentParser(description="Load recipes into Weaviate database")
     parser.add_argument("--recipes-dir", required=True, help="Directory containing recipe markdown files")
     parser.add_argument("--csv-file", help="CSV file with recipe metadata")
-    parser.add_argument("--batch-size", type=int, default=10, help="Batch size for processing")
+    parser.add_argument("--batch-size", type=int, default=None,
+                        help="Recipes per insert request (default: WEAVIATE_BATCH_SIZE)")
+    parser.add_argument("--log-every", type=int, default=10, help="Number of parsed files between progress messages")
+    parser.add_argument("--parse-workers", type=int, default=None,
+                        help="Processes parsing recipe files in parallel; 0 uses all but one core "
+                             "(default: INGEST_PARSE_WORKERS or 1)")
+    parser.add_argument("--async", dest="use_async", action="store_true",
+                        help="Insert with the async client, keeping several batches in flight")
+    parser.add_argument("--inflight", "--concurrency", dest="inflight", type=int, default=8,
+                        help="Concurrent insert requests with --async")
+    parser.add_argument("--auto-batch", action="store_true", default=None,
+                        help="Benchmark insert batch sizes on the first recipes and use the fastest")
+    parser.add_argument("--cache-dir", help="Directory caching parsed recipe files, so re-runs skip unchanged files")
     parser.add_argument("--verbose", "-v", action="store_true", help="Enable verbose logging")
     
     args = parser.parse_args()
@@ -34,15 +47,29 @@ def main():
     
     logger = logging.getLogger(__name__)
     
-    loader = RecipeDataLoader()
+    loader = RecipeDataLoader(cache_dir=args.cache_dir, auto_batch=args.auto_batch)
     
     # Load recipes
     if args.csv_file:
         logger.info(f"Loading recipes from CSV: {args.csv_file}")
         stats = loader.load_recipe_from_csv(args.csv_file, args.recipes_dir)
+    elif args.use_async:
+        logger.info(f"Loading recipes from directory with async client: {args.recipes_dir}")
+        stats = asyncio.run(loader.aload_recipes_from_directory(
+            args.recipes_dir,
+            batch_size=args.batch_size,
+            inflight=args.inflight,
+            parse_workers=args.parse_workers,
+            log_every=args.log_every
+        ))
     else:
         logger.info(f"Loading recipes from directory: {args.recipes_dir}")
-        stats = loader.load_recipes_from_directory(args.recipes_dir, batch_size=args.batch_size)
+        stats = loader.load_recipes_from_directory(
+            args.recipes_dir,
+            batch_size=args.batch_size,
+            parse_workers=args.parse_workers,
+            log_every=args.log_every
+        )
     
     # Print results
     print(f"\nLoading completed:")
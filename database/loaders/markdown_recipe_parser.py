@@ -5,15 +5,47 @@ This module provides functionality to parse markdown recipe files
 with frontmatter and extract structured recipe data.
 """
 
+import contextlib
+import hashlib
+import os
+import pickle
 import re
-from typing import Dict, Any, Optional, Tuple
+import tempfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple, Union
 from pathlib import Path
 import logging
 
+import yaml
+
 from ..models import RecipeDocument
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
 logger = logging.getLogger(__name__)
 
+# Section header lines ("## ..." or "### ...") with their leading newline
+_HEADER_RE = re.compile(r'\n##[^\n]*')
+# Frontmatter values that start a YAML list, mapping or block scalar
+_YAML_COMPOUND_STARTS = ('[', '{', '|', '>')
+# `tags`, which never span lines
+_TAG_RE = re.compile(r'`([^`\n]+)`')
+
+# Recently parsed recipes kept in memory per process; RecipeDocument is
+# immutable, so cached instances are shared between callers. Kept small, as
+# each entry holds the full file content: it only serves files looked up
+# again shortly after (e.g. by duplicate CSV rows), while the on-disk parse
+# cache handles reuse across a whole directory or between runs
+_PARSE_MEMO_SIZE = 128
+
+# Bump when parsing changes so cached results from older versions are ignored
+_PARSE_CACHE_VERSION = 1
+
 
 class MarkdownRecipeParser:
     """Parser for markdown recipe files with frontmatter."""
@@ -23,6 +55,12 @@ class MarkdownRecipeParser:
         """
         Parse YAML frontmatter from markdown content.
         
+        Flat "key: value" frontmatter, as written by the recipe parser, is
+        read line by line, which is about ten times faster than a YAML
+        parser. Frontmatter with lists, nested keys or block scalars is
+        loaded with PyYAML's libyaml-based loader instead, unless it is not
+        valid YAML.
+        
         Args:
             content: Raw markdown content with frontmatter
             
@@ -36,25 +74,76 @@ class MarkdownRecipeParser:
         if content.startswith('---'):
             parts = content.split('---', 2)
             if len(parts) >= 3:
-                frontmatter_text = parts[1].strip()
                 body = parts[2].strip()
-                
-                # Simple YAML parsing for common cases
-                for line in frontmatter_text.split('\n'):
-                    line = line.strip()
-                    if ':' in line and not line.startswith('#'):
-                        key, value = line.split(':', 1)
-                        key = key.strip().strip('"\'')
-                        value = value.strip().strip('"\'')
-                        frontmatter[key] = value
+                frontmatter, is_flat = MarkdownRecipeParser._parse_simple_frontmatter(parts[1])
+                if not is_flat:
+                    try:
+                        loaded = yaml.load(parts[1], Loader=_YamlLoader)
+                    except yaml.YAMLError as e:
+                        logger.debug("Frontmatter is not valid YAML, using simple parsing: %s", e)
+                        loaded = None
+                    if isinstance(loaded, dict):
+                        frontmatter = loaded
         
         return frontmatter, body
     
+    @staticmethod
+    def _parse_simple_frontmatter(frontmatter_text: str) -> Tuple[Dict[str, str], bool]:
+        """
+        Parse frontmatter as "key: value" lines.
+        
+        Returns:
+            Tuple of (frontmatter_dict, whether every entry was a flat scalar)
+        """
+        frontmatter = {}
+        is_flat = True
+        for line in frontmatter_text.strip().split('\n'):
+            stripped = line.strip()
+            if not stripped or stripped.startswith('#'):
+                continue
+            # List items and indented (nested) lines need a YAML parser
+            if stripped.startswith('-') or line[0] in ' \t':
+                is_flat = False
+            if ':' in stripped:
+                key, value = stripped.split(':', 1)
+                key = key.strip().strip('"\'')
+                value = value.strip()
+                if value.startswith(_YAML_COMPOUND_STARTS):
+                    is_flat = False
+                frontmatter[key] = value.strip('"\'')
+        return frontmatter, is_flat
+    
+    @staticmethod
+    def _text(value: Any, default: str = '') -> str:
+        """Convert a frontmatter value to the text stored on a recipe."""
+        if value is None:
+            return default
+        if isinstance(value, str):
+            return value
+        if isinstance(value, list):
+            return ', '.join(str(item) for item in value)
+        return str(value)
+    
+    @staticmethod
+    def _tags(value: Any) -> List[str]:
+        """Read frontmatter tags given as a YAML list or a comma-separated string."""
+        if not value:
+            return []
+        if isinstance(value, str):
+            return [tag.strip() for tag in value.strip('[]').split(',') if tag.strip()]
+        if isinstance(value, list):
+            return [str(tag) for tag in value if tag is not None]
+        return [str(value)]
+    
     @staticmethod
     def extract_sections(markdown_content: str) -> Dict[str, Any]:
         """
         Extract structured sections from markdown content.
         
+        Headers are found with one regex scan and each section is sliced out
+        whole; only sections holding `tags` are split into lines, to drop the
+        tag lines from the section content.
+        
         Args:
             markdown_content: Markdown text content
             
@@ -67,84 +156,199 @@ class MarkdownRecipeParser:
             'tags': []
         }
         
-        # Split content by headers
-        lines = markdown_content.split('\n')
+        tags = sections['tags']
+        
+        # With a newline prepended, every header (even on the first line) is
+        # matched as "\n##..."; the literal prefix lets re skip ahead quickly.
+        # Each span runs from the end of one header line to the start of the
+        # next and holds that section's lines, each preceded by a newline.
+        text = '\n' + markdown_content
+        spans = []
+        position = 0
         current_section = None
-        current_content = []
-        
-        for line in lines:
-            # Check for section headers
-            if line.startswith('##') or line.startswith('###'):
-                # Save previous section
-                if current_section and current_content:
-                    content = '\n'.join(current_content).strip()
-                    if current_section in sections:
-                        sections[current_section] = content
-                
-                # Start new section
-                header = line.strip('#').strip().lower()
-                if 'zutat' in header or 'ingredient' in header:
-                    current_section = 'ingredients'
-                elif 'zubereitung' in header or 'anleitung' in header or 'instruction' in header:
-                    current_section = 'instructions'
-                else:
-                    current_section = None
-                current_content = []
-            
-            # Extract tags from special markdown syntax
-            elif '`' in line:
-                tags = re.findall(r'`([^`]+)`', line)
-                sections['tags'].extend(tags)
+        for match in _HEADER_RE.finditer(text):
+            spans.append((current_section, text[position:match.start()]))
+            position = match.end()
             
-            # Add content to current section
-            elif current_section:
-                current_content.append(line)
+            # Start new section
+            header = match.group()[1:].strip('#').strip().lower()
+            if 'zutat' in header or 'ingredient' in header:
+                current_section = 'ingredients'
+            elif 'zubereitung' in header or 'anleitung' in header or 'instruction' in header:
+                current_section = 'instructions'
+            else:
+                current_section = None
+        spans.append((current_section, text[position:]))
         
-        # Save last section
-        if current_section and current_content:
-            content = '\n'.join(current_content).strip()
-            if current_section in sections:
-                sections[current_section] = content
+        for section, span in spans:
+            if not span:
+                continue
+            content = span[1:]
+            
+            # Extract tags from special markdown syntax; tag lines are not content
+            if '`' in content:
+                tags.extend(_TAG_RE.findall(content))
+                if section:
+                    lines = [line for line in content.split('\n') if '`' not in line]
+                    if lines:
+                        sections[section] = '\n'.join(lines).strip()
+            elif section:
+                sections[section] = content.strip()
         
         return sections
     
-    def parse_recipe_file(self, file_path: str) -> Optional[RecipeDocument]:
+    @staticmethod
+    def parse_recipe_file(file_path: Union[str, Path], cache_dir: Optional[str] = None) -> Optional[RecipeDocument]:
         """
         Parse a single markdown recipe file.
         
+        A staticmethod so it pickles by reference when sent to parser processes.
+        
+        The most recently parsed recipes are kept in memory per path,
+        modification time and size, so a file referenced several times in
+        short order (e.g. by duplicate CSV rows) is read and parsed once.
+        With a cache directory, the
+        parsed recipe is also pickled there and reused as long as the file is
+        unchanged, so re-running an import skips parsing unchanged files.
+        
         Args:
-            file_path: Path to the markdown file
+            file_path: Path to the markdown file, as a string or Path
+            cache_dir: Optional directory for cached parse results
             
         Returns:
             RecipeDocument or None if parsing failed
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Parse frontmatter and body
-            frontmatter, body = self.parse_frontmatter(content)
-            
-            # Extract structured sections
-            sections = self.extract_sections(body)
-            
-            # Create recipe document
-            recipe = RecipeDocument(
-                title=frontmatter.get('title', Path(file_path).stem),
-                source=frontmatter.get('source', ''),
-                cuisine=frontmatter.get('cuisine', ''),
-                prep_time=frontmatter.get('prep_time', ''),
-                cook_time=frontmatter.get('cook_time', ''),
-                servings=frontmatter.get('servings', ''),
-                ingredients=sections.get('ingredients', ''),
-                instructions=sections.get('instructions', ''),
-                tags=sections.get('tags', []),
-                content=content
-            )
-            
-            logger.debug(f"Parsed recipe: {recipe.title}")
-            return recipe
+            stat = os.stat(file_path)
+            return _parse_file_cached(os.fspath(file_path), stat.st_mtime_ns, stat.st_size, cache_dir)
+        except Exception as e:
+            logger.error("Failed to parse recipe file %s: %s", file_path, e)
+            return None
+    
+    @staticmethod
+    def _parse_file(file_path: str, mtime_ns: int, size: int, cache_dir: Optional[str]) -> RecipeDocument:
+        """Read and parse a recipe file whose stat() gave mtime_ns and size; raises on failure."""
+        if cache_dir is not None:
+            cache_key = (_PARSE_CACHE_VERSION, mtime_ns, size)
+            cache_path = MarkdownRecipeParser._cache_path(cache_dir, file_path)
+            recipe = MarkdownRecipeParser._load_cached(cache_path, cache_key)
+            if recipe is not None:
+                return recipe
+        
+        # One read of the whole file, decoded in a single call; newlines
+        # are normalized as text mode would, without its extra buffering
+        with open(file_path, 'rb') as f:
+            content = f.read().decode('utf-8')
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+        
+        # Parse frontmatter and body
+        frontmatter, body = MarkdownRecipeParser.parse_frontmatter(content)
+        
+        # Extract structured sections
+        sections = MarkdownRecipeParser.extract_sections(body)
+        
+        # Create recipe document; YAML values may be numbers, dates or lists
+        text = MarkdownRecipeParser._text
+        title = frontmatter.get('title')
+        recipe = RecipeDocument(
+            # Fall back to the file name without its extension
+            title=text(title) if title is not None else os.path.splitext(os.path.basename(file_path))[0],
+            source=text(frontmatter.get('source')),
+            cuisine=text(frontmatter.get('cuisine')),
+            prep_time=text(frontmatter.get('prep_time')),
+            cook_time=text(frontmatter.get('cook_time')),
+            servings=text(frontmatter.get('servings')),
+            ingredients=sections.get('ingredients', ''),
+            instructions=sections.get('instructions', ''),
+            tags=MarkdownRecipeParser._tags(frontmatter.get('tags')) + sections.get('tags', []),
+            content=content
+        )
+        
+        if cache_dir is not None:
+            MarkdownRecipeParser._store_cached(cache_path, cache_key, recipe)
+        
+        # Called once per file from the batch loaders
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Parsed recipe: %s", recipe.title)
+        return recipe
+    
+    @staticmethod
+    def parse_recipes(file_paths: Iterable[str],
+                      max_workers: int = 16,
+                      cache_dir: Optional[str] = None,
+                      window: Optional[int] = None) -> Iterator[Optional[RecipeDocument]]:
+        """
+        Parse recipe files in a thread pool, yielding results in input order.
+        
+        File reads and UTF-8 decoding release the GIL, so several reads are
+        in flight at once; at most window files are read ahead of the
+        consumer, which keeps memory bounded for large directories.
+        
+        Args:
+            file_paths: Paths to the markdown files
+            max_workers: Number of reader threads
+            cache_dir: Optional directory for cached parse results
+            window: Maximum number of files parsed ahead (default: 4 per thread)
             
+        Yields:
+            RecipeDocument, or None for each file that failed to parse
+        """
+        window = window or max_workers * 4
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="recipe-parse") as executor:
+            try:
+                for file_path in file_paths:
+                    pending.append(executor.submit(MarkdownRecipeParser.parse_recipe_file, file_path, cache_dir))
+                    if len(pending) >= window:
+                        yield pending.popleft().result()
+                while pending:
+                    yield pending.popleft().result()
+            finally:
+                for future in pending:
+                    future.cancel()
+    
+    @staticmethod
+    def _cache_path(cache_dir: str, file_path: str) -> Path:
+        """Cache file for a recipe file, named by a hash of its absolute path."""
+        digest = hashlib.sha1(os.path.abspath(file_path).encode('utf-8')).hexdigest()
+        return Path(cache_dir) / f"{digest}.pkl"
+    
+    @staticmethod
+    def _load_cached(cache_path: Path, cache_key: Tuple[int, ...]) -> Optional[RecipeDocument]:
+        """Load a cached recipe if it was stored for the same file version."""
+        try:
+            with open(cache_path, 'rb') as f:
+                stored_key, recipe = pickle.load(f)
+        except FileNotFoundError:
+            return None
         except Exception as e:
-            logger.error(f"Failed to parse recipe file {file_path}: {e}")
+            logger.debug("Ignoring unreadable parse cache %s: %s", cache_path, e)
             return None
+        return recipe if stored_key == cache_key else None
+    
+    @staticmethod
+    def _store_cached(cache_path: Path, cache_key: Tuple[int, ...], recipe: RecipeDocument):
+        """Write a parsed recipe to the cache; failures only cost a re-parse later."""
+        tmp_path = None
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a uniquely named file and rename, so parallel parsers
+            # (threads or processes) never read a partial file
+            with tempfile.NamedTemporaryFile('wb', dir=cache_path.parent, prefix=cache_path.stem,
+                                             suffix='.tmp', delete=False) as f:
+                tmp_path = f.name
+                pickle.dump((cache_key, recipe), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning("Failed to write parse cache %s: %s", cache_path, e)
+            if tmp_path is not None:
+                with contextlib.suppress(OSError):
+                    os.remove(tmp_path)
+
+
+@lru_cache(maxsize=_PARSE_MEMO_SIZE)
+def _parse_file_cached(file_path: str, mtime_ns: int, size: int,
+                       cache_dir: Optional[str]) -> RecipeDocument:
+    """Memoize parses by file version; failures raise and are not cached."""
+    return MarkdownRecipeParser._parse_file(file_path, mtime_ns, size, cache_dir)
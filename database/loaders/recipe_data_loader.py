@@ -6,54 +6,87 @@ This module provides functionality to load recipes from various sources
 """
 
 import re
+import asyncio
+import copy
 import csv
-from typing import Dict, Any, Optional
+import fnmatch
+import importlib.util
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+from functools import partial
+from typing import Dict, Any, Iterable, Iterator, List, Optional
 from pathlib import Path
 import logging
 
-from ..config import WeaviateConfig
+from ..config import WeaviateConfig, SETTINGS
 from ..core import RecipeVectorDatabase
+from ..models import RecipeDocument
 from .markdown_recipe_parser import MarkdownRecipeParser
 
 logger = logging.getLogger(__name__)
 
+# Normalization of CSV titles to recipe file names
+_NON_FN = re.compile(r'[^\w\-_.]')
+_DASHES = re.compile(r'-+')
+
+# pyarrow's CSV reader is used for large CSV files when it is installed
+PYARROW_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
+# Smaller CSV files are read with the csv module, which starts up faster
+PYARROW_CSV_MIN_BYTES = 1 << 20
+# Recipe files smaller than this cannot hold a recipe and are skipped
+MIN_RECIPE_FILE_BYTES = 32
+# Columns read from recipe list CSV files
+_CSV_COLUMNS = ('title', 'url')
 
 class RecipeDataLoader:
     """Main class for loading recipe data into Weaviate database."""
     
-    def __init__(self, config: Optional[WeaviateConfig] = None):
+    def __init__(self,
+                 config: Optional[WeaviateConfig] = None,
+                 cache_dir: Optional[str] = None,
+                 auto_batch: Optional[bool] = None):
         """
         Initialize the data loader.
         
         Args:
             config: Optional Weaviate configuration
+            cache_dir: Optional directory caching parsed recipe files between runs
+            auto_batch: Benchmark batch sizes on the first recipes before a
+                batch insert (default: SETTINGS.WEAVIATE_AUTOTUNE)
         """
         self.config = config or WeaviateConfig()
         self.parser = MarkdownRecipeParser()
+        self.cache_dir = cache_dir
+        self.auto_batch = auto_batch
     
     def load_recipes_from_directory(self, 
                                    directory_path: str,
                                    pattern: str = "*.md",
-                                   batch_size: int = 10) -> Dict[str, Any]:
+                                   batch_size: Optional[int] = None,
+                                   parse_workers: Optional[int] = None,
+                                   log_every: int = 10) -> Dict[str, Any]:
         """
         Load all recipe files from a directory.
         
         Args:
             directory_path: Path to directory containing recipe files
             pattern: File pattern to match (default: *.md)
-            batch_size: Number of recipes to process in each batch
+            batch_size: Recipes per insert request (default: the loader
+                config's batch size, i.e. WEAVIATE_BATCH_SIZE)
+            parse_workers: Number of processes parsing files in parallel
+                (default: SETTINGS.INGEST_PARSE_WORKERS; 0 uses all but one core)
+            log_every: Number of parsed files between progress log messages
             
         Returns:
             Dict with loading statistics
         """
         try:
-            directory = Path(directory_path)
-            if not directory.exists():
-                raise FileNotFoundError(f"Directory not found: {directory_path}")
-            
             # Find all matching files
-            recipe_files = list(directory.glob(pattern))
-            logger.info(f"Found {len(recipe_files)} recipe files in {directory_path}")
+            recipe_files = self._find_recipe_files(directory_path, pattern)
+            logger.info("Found %s recipe files in %s", len(recipe_files), directory_path)
             
             if not recipe_files:
                 return {
@@ -64,42 +97,24 @@ class RecipeDataLoader:
                     "errors": []
                 }
             
-            # Process files in batches
-            successful = 0
-            failed = 0
-            errors = []
-            
-            with RecipeVectorDatabase(self.config) as db:
-                for i in range(0, len(recipe_files), batch_size):
-                    batch_files = recipe_files[i:i + batch_size]
-                    batch_recipes = []
-                    
-                    # Parse batch of files
-                    for file_path in batch_files:
-                        recipe = self.parser.parse_recipe_file(str(file_path))
-                        if recipe:
-                            batch_recipes.append(recipe)
-                        else:
-                            failed += 1
-                            errors.append(f"Failed to parse: {file_path}")
-                    
-                    # Insert batch to database
-                    if batch_recipes:
-                        result = db.add_recipes_batch(batch_recipes)
-                        batch_successful = result.get("successful", 0)
-                        batch_failed = result.get("total", 0) - batch_successful
-                        
-                        successful += batch_successful
-                        failed += batch_failed
-                        
-                        if batch_failed > 0:
-                            errors.append(f"Failed to insert {batch_failed} recipes from batch")
-                            if result.get("errors"):
-                                errors.extend(result["errors"][:3])  # Add first 3 errors
-                    
-                    logger.info(f"Processed batch {i//batch_size + 1}: "
-                              f"{len(batch_recipes)} recipes parsed, "
-                              f"{successful} total successful so far")
+            parse_errors = []
+            config = self._insert_config(batch_size)
+            with RecipeVectorDatabase(config) as db:
+                # Files are parsed lazily while the batcher sends earlier ones
+                result = db.add_recipes_batch(
+                    self._iter_recipes(recipe_files, parse_errors, log_every, parse_workers, config.batch_size),
+                    autotune=self.auto_batch
+                )
+            
+            successful = result.get("successful", 0)
+            insert_failed = result.get("total", 0) - successful
+            failed = len(parse_errors) + insert_failed
+            errors = parse_errors
+            
+            if insert_failed > 0:
+                errors.append(f"Failed to insert {insert_failed} recipes")
+            if result.get("errors"):
+                errors.extend(result["errors"][:3])  # Add first 3 errors
             
             return {
                 "status": "completed",
@@ -110,7 +125,7 @@ class RecipeDataLoader:
             }
             
         except Exception as e:
-            logger.error(f"Failed to load recipes from directory: {e}")
+            logger.error("Failed to load recipes from directory: %s", e)
             return {
                 "status": "error",
                 "error": str(e),
@@ -120,10 +135,213 @@ class RecipeDataLoader:
                 "errors": [str(e)]
             }
     
+    async def aload_recipes_from_directory(self,
+                                           directory_path: str,
+                                           pattern: str = "*.md",
+                                           batch_size: Optional[int] = None,
+                                           inflight: int = 8,
+                                           parse_workers: Optional[int] = None,
+                                           log_every: int = 10) -> Dict[str, Any]:
+        """
+        Load all recipe files from a directory using the async client.
+        
+        Up to inflight insert requests are kept running concurrently, which
+        overlaps server-side vectorization of one chunk with the upload of
+        the next ones.
+        
+        Args:
+            directory_path: Path to directory containing recipe files
+            pattern: File pattern to match (default: *.md)
+            batch_size: Recipes per insert request (default: the loader
+                config's batch size, i.e. WEAVIATE_BATCH_SIZE)
+            inflight: Maximum number of concurrent insert requests
+            parse_workers: Number of processes parsing files in parallel
+                (default: SETTINGS.INGEST_PARSE_WORKERS; 0 uses all but one core)
+            log_every: Number of parsed files between progress log messages
+            
+        Returns:
+            Dict with loading statistics
+        """
+        try:
+            recipe_files = await asyncio.to_thread(self._find_recipe_files, directory_path, pattern)
+            logger.info("Found %s recipe files in %s", len(recipe_files), directory_path)
+            
+            parse_errors = []
+            config = self._insert_config(batch_size)
+            async with RecipeVectorDatabase(config) as db:
+                # The parsing generator is consumed in a worker thread by
+                # aadd_recipes_batch, so parsing overlaps the in-flight inserts
+                result = await db.aadd_recipes_batch(
+                    self._iter_recipes(recipe_files, parse_errors, log_every, parse_workers, config.batch_size),
+                    inflight=inflight
+                )
+            
+            successful = result.get("successful", 0)
+            insert_failed = result.get("total", 0) - successful
+            failed = len(parse_errors) + insert_failed
+            errors = parse_errors
+            
+            if insert_failed > 0:
+                errors.append(f"Failed to insert {insert_failed} recipes")
+            if result.get("errors"):
+                errors.extend(result["errors"][:3])  # Add first 3 errors
+            
+            return {
+                "status": "completed",
+                "total_files": len(recipe_files),
+                "successful": successful,
+                "failed": failed,
+                "errors": errors
+            }
+            
+        except Exception as e:
+            logger.error("Failed to load recipes from directory: %s", e)
+            return {
+                "status": "error",
+                "error": str(e),
+                "total_files": 0,
+                "successful": 0,
+                "failed": 0,
+                "errors": [str(e)]
+            }
+    
+    def _insert_config(self, batch_size: Optional[int]) -> WeaviateConfig:
+        """Return the loader config, with the insert batch size overridden if one is given."""
+        if batch_size is None or batch_size == self.config.batch_size:
+            return self.config
+        config = copy.copy(self.config)
+        config.batch_size = batch_size
+        return config
+    
+    @staticmethod
+    def _find_recipe_files(directory_path: str, pattern: str) -> List[str]:
+        """
+        List the recipe files in a directory that match a file name pattern.
+        
+        Plain file name patterns are matched against one os.scandir() listing,
+        whose entries carry the file size, so files too small to hold a recipe
+        are skipped without being opened. Patterns with directory parts
+        (e.g. "**/*.md") are expanded with Path.glob().
+        
+        Args:
+            directory_path: Path to directory containing recipe files
+            pattern: File pattern to match
+            
+        Returns:
+            Paths of the matching files
+            
+        Raises:
+            FileNotFoundError: If the directory does not exist
+        """
+        directory = Path(directory_path)
+        if not directory.is_dir():
+            raise FileNotFoundError(f"Directory not found: {directory_path}")
+        
+        if '/' in pattern or os.sep in pattern:
+            recipe_files = [
+                str(file_path) for file_path in directory.glob(pattern)
+                if file_path.is_file() and file_path.stat().st_size >= MIN_RECIPE_FILE_BYTES
+            ]
+        else:
+            # Like glob, wildcards do not match hidden files
+            match_hidden = pattern.startswith('.')
+            with os.scandir(directory) as entries:
+                recipe_files = [
+                    entry.path for entry in entries
+                    if (match_hidden or not entry.name.startswith('.'))
+                    and fnmatch.fnmatchcase(entry.name, pattern)
+                    and entry.is_file()
+                    and entry.stat().st_size >= MIN_RECIPE_FILE_BYTES
+                ]
+        return recipe_files
+    
+    def _iter_recipes(self,
+                      recipe_files: List[str],
+                      errors: List[str],
+                      log_every: int,
+                      parse_workers: Optional[int] = 1,
+                      batch_size: Optional[int] = None) -> Iterator[RecipeDocument]:
+        """
+        Parse recipe files, yielding each parsed recipe in file order.
+        
+        With more than one parse worker, files are parsed in a process pool
+        so the CPU-bound markdown/YAML parsing runs on several cores while
+        the caller sends earlier recipes to the database. Otherwise files
+        are read by a thread pool a bounded number of files ahead, so file
+        reads overlap each other and the inserts.
+        
+        Args:
+            recipe_files: Markdown files to parse
+            errors: List that receives a message for each file that fails to parse
+            log_every: Log progress after this many files
+            parse_workers: Number of parser processes (1 parses in-process,
+                0 uses all but one core, None uses SETTINGS.INGEST_PARSE_WORKERS)
+            batch_size: Insert batch size, which sets how far ahead files are
+                read (default: the loader config's batch size)
+            
+        Yields:
+            Parsed recipe documents
+        """
+        if parse_workers is None:
+            parse_workers = SETTINGS.INGEST_PARSE_WORKERS
+        if parse_workers == 0:
+            parse_workers = max(1, (os.cpu_count() or 1) - 1)
+        
+        if parse_workers > 1 and len(recipe_files) > 1:
+            # Spawned, not forked: the caller may already hold a gRPC client
+            executor = ProcessPoolExecutor(
+                max_workers=parse_workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+            # About four chunks per worker balances IPC overhead against stragglers
+            parsed = executor.map(
+                partial(MarkdownRecipeParser.parse_recipe_file, cache_dir=self.cache_dir),
+                recipe_files,
+                chunksize=max(1, len(recipe_files) // (parse_workers * 4))
+            )
+        else:
+            executor = None
+            if batch_size is None:
+                batch_size = self.config.batch_size
+            if batch_size <= 0:
+                batch_size = 100
+            parsed = MarkdownRecipeParser.parse_recipes(
+                recipe_files,
+                cache_dir=self.cache_dir,
+                window=2 * batch_size
+            )
+        
+        try:
+            yield from self._collect_parsed(recipe_files, parsed, errors, log_every)
+        finally:
+            if executor is None:
+                parsed.close()
+            else:
+                executor.shutdown(cancel_futures=True)
+    
+    @staticmethod
+    def _collect_parsed(recipe_files: List[str],
+                        parsed: Iterator[Optional[RecipeDocument]],
+                        errors: List[str],
+                        log_every: int) -> Iterator[RecipeDocument]:
+        """Yield successfully parsed recipes, recording failures and logging progress."""
+        for count, (file_path, recipe) in enumerate(zip(recipe_files, parsed), 1):
+            if recipe:
+                yield recipe
+            else:
+                errors.append(f"Failed to parse: {file_path}")
+            
+            if count % log_every == 0:
+                logger.info("Parsed %d of %d recipe files", count, len(recipe_files))
+    
     def load_recipe_from_csv(self, csv_path: str, recipes_dir: str) -> Dict[str, Any]:
         """
         Load recipes from a CSV file that contains recipe metadata.
         
+        Rows are streamed: each row is matched to its markdown file, parsed
+        and handed to the database batcher as it is read, so memory use does
+        not grow with the size of the CSV and inserts start right away.
+        
         Args:
             csv_path: Path to CSV file with recipe list
             recipes_dir: Directory containing recipe markdown files
@@ -140,19 +358,115 @@ class RecipeDataLoader:
                 "errors": []
             }
             
-            # Read CSV file
-            with open(csv_path, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                recipes_data = list(reader)
+            rows = self._iter_csv_rows(csv_path)
+            try:
+                with RecipeVectorDatabase(self.config) as db:
+                    result = db.add_recipes_batch(
+                        self._iter_csv_recipes(rows, recipes_dir, stats),
+                        autotune=self.auto_batch
+                    )
+            finally:
+                rows.close()
+            
+            logger.info("Found %s recipes in CSV file", stats["total_recipes"])
             
-            stats["total_recipes"] = len(recipes_data)
-            logger.info(f"Found {len(recipes_data)} recipes in CSV file")
+            stats["successful"] = result.get("successful", 0)
+            batch_failed = result.get("total", 0) - stats["successful"]
+            stats["failed"] += batch_failed
             
-            recipes_path = Path(recipes_dir)
-            processed_recipes = []
+            if batch_failed > 0:
+                stats["errors"].append(f"Failed to insert {batch_failed} recipes to database")
+            if result.get("errors"):
+                stats["errors"].extend(result["errors"][:3])  # Add first 3 errors
             
-            # Process each recipe entry
-            for row in recipes_data:
+            return stats
+            
+        except Exception as e:
+            logger.error("Failed to load recipes from CSV: %s", e)
+            return {
+                "status": "error",
+                "error": str(e),
+                "total_recipes": 0,
+                "successful": 0,
+                "failed": 0,
+                "errors": [str(e)]
+            }
+    
+    @staticmethod
+    def _iter_csv_rows(csv_path: str) -> Iterator[Dict[str, str]]:
+        """
+        Stream the title and url columns of a recipe list CSV file.
+        
+        Large files are read in record batches with pyarrow when it is
+        installed, which parses in native code; otherwise, and for small
+        files, csv.DictReader is used.
+        
+        Args:
+            csv_path: Path to CSV file with recipe list
+            
+        Yields:
+            Dict per row with the title and url columns ('' when missing)
+        """
+        if PYARROW_AVAILABLE and os.path.getsize(csv_path) >= PYARROW_CSV_MIN_BYTES:
+            import pyarrow as pa
+            import pyarrow.csv as pacsv
+            
+            reader = pacsv.open_csv(
+                csv_path,
+                parse_options=pacsv.ParseOptions(newlines_in_values=True),
+                convert_options=pacsv.ConvertOptions(
+                    column_types={column: pa.string() for column in _CSV_COLUMNS},
+                    include_columns=list(_CSV_COLUMNS),
+                    include_missing_columns=True
+                )
+            )
+            try:
+                for batch in reader:
+                    titles = batch.column(0).to_pylist()
+                    urls = batch.column(1).to_pylist()
+                    for title, url in zip(titles, urls):
+                        yield {'title': title or '', 'url': url or ''}
+            finally:
+                reader.close()
+            return
+        
+        with open(csv_path, 'r', encoding='utf-8', newline='') as f:
+            yield from csv.DictReader(f)
+    
+    def _iter_csv_recipes(self,
+                          rows: Iterable[Dict[str, str]],
+                          recipes_dir: str,
+                          stats: Dict[str, Any]) -> Iterator[RecipeDocument]:
+        """
+        Match CSV rows to recipe files and yield the parsed recipes in row order.
+        
+        Args:
+            rows: CSV rows with title and url columns
+            recipes_dir: Directory containing recipe markdown files
+            stats: Loading statistics, updated with row counts and failures
+            
+        Yields:
+            Parsed recipe documents, with the source URL from the CSV if missing
+        """
+        # List the directory once instead of globbing it and checking
+        # candidate paths with a stat call for every row
+        with os.scandir(recipes_dir) as entries:
+            files_by_name = {
+                entry.name: entry.path
+                for entry in entries
+                if entry.name.endswith('.md') and entry.is_file()
+            }
+        recipe_stems = [(name[:-3].lower(), recipe_file) for name, recipe_file in files_by_name.items()]
+        stem_index = {}
+        for stem, recipe_file in recipe_stems:
+            stem_index.setdefault(stem, recipe_file)
+        
+        # Files handed to the parser, oldest first; results come back in order
+        matched_files = deque()
+        
+        def matched_paths() -> Iterator[str]:
+            for row in rows:
+                stats["total_recipes"] += 1
                 title = row.get('title', '')
                 url = row.get('url', '')
                 
@@ -163,63 +477,31 @@ class RecipeDataLoader:
                 
                 # Try to find corresponding markdown file
                 # Convert title to filename (simple normalization)
-                filename = re.sub(r'[^\w\-_.]', '-', title.lower())
-                filename = re.sub(r'-+', '-', filename).strip('-')
+                filename = _DASHES.sub('-', _NON_FN.sub('-', title.lower())).strip('-')
                 
-                # Look for matching files
-                possible_files = [
-                    recipes_path / f"{filename}.md",
-                    recipes_path / f"{title.lower().replace(' ', '-')}.md",
-                ]
-                
-                # Also search by partial filename match
-                for recipe_file in recipes_path.glob("*.md"):
-                    if filename in recipe_file.stem.lower():
-                        possible_files.append(recipe_file)
-                        break
-                
-                recipe_file = None
-                for possible_file in possible_files:
-                    if possible_file.exists():
-                        recipe_file = possible_file
-                        break
+                # Look for matching files, then by exact or partial stem match
+                recipe_file = (
+                    files_by_name.get(f"{filename}.md")
+                    or files_by_name.get(f"{title.lower().replace(' ', '-')}.md")
+                    or stem_index.get(filename)
+                    or next((recipe_file for stem, recipe_file in recipe_stems if filename in stem), None)
+                )
                 
                 if recipe_file:
-                    recipe = self.parser.parse_recipe_file(str(recipe_file))
-                    if recipe:
-                        # Update source URL from CSV if not present
-                        if not recipe.source and url:
-                            recipe.source = url
-                        processed_recipes.append(recipe)
-                    else:
-                        stats["failed"] += 1
-                        stats["errors"].append(f"Failed to parse: {recipe_file}")
+                    matched_files.append((recipe_file, url))
+                    yield recipe_file
                 else:
                     stats["failed"] += 1
                     stats["errors"].append(f"Recipe file not found for: {title}")
-            
-            # Insert all recipes to database
-            if processed_recipes:
-                with RecipeVectorDatabase(self.config) as db:
-                    result = db.add_recipes_batch(processed_recipes)
-                    stats["successful"] = result.get("successful", 0)
-                    batch_failed = result.get("total", 0) - stats["successful"]
-                    stats["failed"] += batch_failed
-                    
-                    if batch_failed > 0:
-                        stats["errors"].append(f"Failed to insert {batch_failed} recipes to database")
-                        if result.get("errors"):
-                            stats["errors"].extend(result["errors"][:3])  # Add first 3 errors
-            
-            return stats
-            
-        except Exception as e:
-            logger.error(f"Failed to load recipes from CSV: {e}")
-            return {
-                "status": "error",
-                "error": str(e),
-                "total_recipes": 0,
-                "successful": 0,
-                "failed": 0,
-                "errors": [str(e)]
-            }
+        
+        # Parse the matched files with overlapping reads
+        for recipe in self.parser.parse_recipes(matched_paths(), cache_dir=self.cache_dir):
+            recipe_file, url = matched_files.popleft()
+            if recipe:
+                # Update source URL from CSV if not present
+                if not recipe.source and url:
+                    recipe = replace(recipe, source=url)
+                yield recipe
+            else:
+                stats["failed"] += 1
+                stats["errors"].append(f"Failed to parse: {recipe_file}")
@@ -2,8 +2,10 @@
 Models module for database package.
 """
 
-from .recipe_document import RecipeDocument
+from .recipe_document import RecipeDocument, RecipeDocumentDict, RecipeStruct
 
 __all__ = [
     "RecipeDocument",
+    "RecipeDocumentDict",
+    "RecipeStruct",
 ]
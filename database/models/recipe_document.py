@@ -5,14 +5,77 @@ This module defines the data class for recipe documents that will be
 stored in the vector database.
 """
 
-from dataclasses import dataclass
-from typing import List, Dict, Any, Optional
+import importlib.util
+import json
+import sys
+from dataclasses import dataclass, fields
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple, TypedDict, Union
 from datetime import datetime, timezone
 
+try:
+    from ..config import SETTINGS
+except ImportError:
+    # models imported as a top-level package, as test_db.py does
+    from config import SETTINGS
 
-@dataclass
+# Try to import msgspec with graceful fallback
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+    msgspec = None
+
+
+if MSGSPEC_AVAILABLE:
+    class RecipeStruct(msgspec.Struct, frozen=True):
+        """C-backed struct mirroring RecipeDocument for fast JSON encoding."""
+        
+        title: str
+        source: str
+        cuisine: str
+        content: str
+        ingredients: str = ""
+        instructions: str = ""
+        prep_time: str = ""
+        cook_time: str = ""
+        servings: str = ""
+        tags: List[str] = []
+else:
+    RecipeStruct = None
+
+# Opt-in orjson encoding, used only if the package is installed
+USE_ORJSON = (
+    SETTINGS.WEAVIATE_USE_ORJSON
+    and importlib.util.find_spec("orjson") is not None
+)
+
+
+class RecipeDocumentDict(TypedDict):
+    """Properties of a recipe as stored in Weaviate, as returned by RecipeDocument.to_dict()."""
+    
+    title: str
+    source: str
+    cuisine: str
+    content: str
+    ingredients: str
+    instructions: str
+    prep_time: str
+    cook_time: str
+    servings: str
+    tags: List[str]
+    created_at: str
+    updated_at: str
+
+
+@dataclass(slots=True, frozen=True)
 class RecipeDocument:
-    """Data class representing a recipe document."""
+    """
+    Immutable data class representing a recipe document.
+    
+    Instances are hashable, so parsed recipes can be deduplicated with a set
+    before ingest. Use dataclasses.replace() to derive a modified copy.
+    """
     
     title: str
     source: str
@@ -23,21 +86,35 @@ class RecipeDocument:
     prep_time: str = ""
     cook_time: str = ""
     servings: str = ""
-    tags: Optional[List[str]] = None
+    tags: Tuple[str, ...] = ()
     
     def __post_init__(self):
-        """Initialize default values after object creation."""
-        if self.tags is None:
-            self.tags = []
+        """Normalize tags to a tuple and intern the low-cardinality cuisine and tags."""
+        tags: Optional[Iterable[str]] = self.tags
+        # Few distinct tags occur across a collection, so one string per tag is shared
+        object.__setattr__(self, "tags", tuple(map(sys.intern, tags)) if tags else ())
+        if isinstance(self.cuisine, str):
+            object.__setattr__(self, "cuisine", sys.intern(self.cuisine))
     
-    def to_dict(self) -> Dict[str, Any]:
+    def to_dict(self, now: Optional[Union[datetime, str]] = None) -> RecipeDocumentDict:
         """
         Convert the recipe document to a dictionary for Weaviate.
         
+        All values are JSON primitives (timestamps as ISO 8601 strings), so
+        the client sends them without further conversion.
+        
+        Args:
+            now: Timestamp for created_at/updated_at; pass one shared value,
+                ideally already formatted with isoformat(), when converting a
+                whole batch to avoid a clock read and formatting per recipe
+        
         Returns:
             Dictionary representation suitable for database storage
         """
-        now = datetime.now().replace(tzinfo=timezone.utc)
+        if now is None:
+            now = datetime.now(timezone.utc)
+        if isinstance(now, datetime):
+            now = now.isoformat()
         return {
             "title": self.title,
             "source": self.source,
@@ -48,11 +125,96 @@ class RecipeDocument:
             "prep_time": self.prep_time,
             "cook_time": self.cook_time,
             "servings": self.servings,
-            "tags": self.tags,
+            "tags": list(self.tags),
             "created_at": now,
             "updated_at": now
         }
     
+    def to_update_dict(self, now: Optional[Union[datetime, str]] = None) -> Dict[str, Any]:
+        """
+        Convert the recipe document to the properties sent when updating it.
+        
+        Unlike to_dict() this leaves out created_at, so the original creation
+        timestamp is kept, and sets only updated_at.
+        
+        Args:
+            now: Timestamp for updated_at; defaults to the current time
+                truncated to whole seconds for a shorter serialized value
+        
+        Returns:
+            Dictionary of updatable properties
+        """
+        if now is None:
+            now = datetime.now(timezone.utc).replace(microsecond=0)
+        if isinstance(now, datetime):
+            now = now.isoformat()
+        return {
+            "title": self.title,
+            "source": self.source,
+            "cuisine": self.cuisine,
+            "content": self.content,
+            "ingredients": self.ingredients,
+            "instructions": self.instructions,
+            "prep_time": self.prep_time,
+            "cook_time": self.cook_time,
+            "servings": self.servings,
+            "tags": list(self.tags),
+            "updated_at": now
+        }
+    
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        """
+        Iterate over (field name, value) pairs without building a dict.
+        
+        Unlike to_dict() no timestamps are added and tags stay a tuple, so
+        code that only reads the fields avoids the clock read and copies.
+        """
+        for name in _FIELD_NAMES:
+            yield name, getattr(self, name)
+    
+    def to_msgspec(self) -> "RecipeStruct":
+        """
+        Convert the recipe document to a msgspec struct (fields are shared, not copied).
+        
+        Returns:
+            RecipeStruct instance
+        """
+        if not MSGSPEC_AVAILABLE:
+            raise ImportError("msgspec package is required. Install with: pip install msgspec")
+        
+        return RecipeStruct(
+            title=self.title,
+            source=self.source,
+            cuisine=self.cuisine,
+            content=self.content,
+            ingredients=self.ingredients,
+            instructions=self.instructions,
+            prep_time=self.prep_time,
+            cook_time=self.cook_time,
+            servings=self.servings,
+            tags=self.tags
+        )
+    
+    def to_json(self) -> bytes:
+        """
+        Serialize the recipe fields to JSON for logging, caching or export.
+        
+        Uses msgspec when installed, which encodes straight from the struct
+        without building an intermediate dict, otherwise orjson if enabled
+        with WEAVIATE_USE_ORJSON=1 and installed, and the json module last.
+        
+        Returns:
+            UTF-8 encoded JSON
+        """
+        if MSGSPEC_AVAILABLE:
+            return msgspec.json.encode(self.to_msgspec())
+        
+        data = dict(self.items())
+        if USE_ORJSON:
+            import orjson
+            return orjson.dumps(data)
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "RecipeDocument":
         """
@@ -74,5 +236,9 @@ class RecipeDocument:
             prep_time=data.get("prep_time", ""),
             cook_time=data.get("cook_time", ""),
             servings=data.get("servings", ""),
-            tags=data.get("tags", [])
+            tags=data.get("tags", ())
         )
+
+
+# Field names in declaration order, for RecipeDocument.items()
+_FIELD_NAMES = tuple(field.name for field in fields(RecipeDocument))
@@ -5,18 +5,18 @@ This module defines the schema configuration for recipe documents
 in the Weaviate vector database using v4 API.
 """
 
-from ..config.settings import DatabaseSettings
+import importlib.util
 
-# Try to import weaviate with graceful fallback
-try:
-    from weaviate.classes.config import Configure, Property, DataType, VectorDistances
-    WEAVIATE_AVAILABLE = True
-except ImportError:
-    WEAVIATE_AVAILABLE = False
-    Configure = None
-    Property = None
-    DataType = None
-    VectorDistances = None
+from ..config.settings import SETTINGS
+
+# The weaviate config classes are imported inside each method, on first use
+WEAVIATE_AVAILABLE = importlib.util.find_spec("weaviate") is not None
+
+# Schema objects never change within a process, so they are built on first
+# use and then shared instead of being rebuilt on every call
+_VECTOR_INDEX_CONFIG = None
+_VECTORIZER_CONFIG = None
+_PROPERTIES = None
 
 
 class RecipeSchema:
@@ -27,15 +27,35 @@ class RecipeSchema:
         """
         Get the vector configuration for Recipe objects using v4 API.
         
+        The index type is chosen by WEAVIATE_INDEX. "hnsw" builds a graph
+        index that scales to millions of objects. "flat_rq" uses a brute-force
+        flat index with 8-bit rotational quantization, which for a personal
+        recipe collection (thousands of objects) needs far less memory, has
+        no graph to build and keeps recall close to 100%; it requires
+        Weaviate 1.32 or newer.
+        
         Returns:
             Vector configuration for Weaviate v4
         """
         if not WEAVIATE_AVAILABLE:
             raise ImportError("weaviate package is required for schema configuration")
         
-        return Configure.VectorIndex.hnsw(
-            distance_metric=VectorDistances.COSINE
-        )
+        global _VECTOR_INDEX_CONFIG
+        if _VECTOR_INDEX_CONFIG is None:
+            from weaviate.classes.config import Configure, VectorDistances
+            
+            if SETTINGS.WEAVIATE_INDEX == "flat_rq":
+                _VECTOR_INDEX_CONFIG = Configure.VectorIndex.flat(
+                    distance_metric=VectorDistances.COSINE,
+                    quantizer=Configure.VectorIndex.Quantizer.rq(bits=8)
+                )
+            elif SETTINGS.WEAVIATE_INDEX == "hnsw":
+                _VECTOR_INDEX_CONFIG = Configure.VectorIndex.hnsw(
+                    distance_metric=VectorDistances.COSINE
+                )
+            else:
+                raise ValueError(f"Unknown WEAVIATE_INDEX {SETTINGS.WEAVIATE_INDEX!r}; expected 'hnsw' or 'flat_rq'")
+        return _VECTOR_INDEX_CONFIG
     
     @staticmethod
     def get_vectorizer_config():
@@ -43,27 +63,37 @@ class RecipeSchema:
         if not WEAVIATE_AVAILABLE:
             raise ImportError("weaviate package is required for vectorizer configuration")
         
-        return Configure.Vectorizer.text2vec_openai(
-            model=DatabaseSettings.DEFAULT_EMBEDDING_MODEL
-        )
+        global _VECTORIZER_CONFIG
+        if _VECTORIZER_CONFIG is None:
+            from weaviate.classes.config import Configure
+            
+            _VECTORIZER_CONFIG = Configure.Vectorizer.text2vec_openai(
+                model=SETTINGS.DEFAULT_EMBEDDING_MODEL
+            )
+        return _VECTORIZER_CONFIG
     
     @staticmethod
     def get_properties():
-        """Get the properties configuration for Recipe collection."""
+        """Get the properties configuration for Recipe collection (as a shared, immutable tuple)."""
         if not WEAVIATE_AVAILABLE:
             raise ImportError("weaviate package is required for properties configuration")
         
-        return [
-            Property(name="title", data_type=DataType.TEXT, description="The title/name of the recipe"),
-            Property(name="source", data_type=DataType.TEXT, description="The original URL or source of the recipe"),
-            Property(name="cuisine", data_type=DataType.TEXT, description="The cuisine type (e.g., italienisch, deutsch, asiatisch)"),
-            Property(name="prep_time", data_type=DataType.TEXT, description="Preparation time for the recipe"),
-            Property(name="cook_time", data_type=DataType.TEXT, description="Cooking time for the recipe"),
-            Property(name="servings", data_type=DataType.TEXT, description="Number of servings"),
-            Property(name="ingredients", data_type=DataType.TEXT, description="Recipe ingredients"),
-            Property(name="instructions", data_type=DataType.TEXT, description="Step-by-step cooking instructions"),
-            Property(name="tags", data_type=DataType.TEXT_ARRAY, description="Recipe tags"),
-            Property(name="content", data_type=DataType.TEXT, description="Full recipe content"),
-            Property(name="created_at", data_type=DataType.DATE, description="Creation timestamp"),
-            Property(name="updated_at", data_type=DataType.DATE, description="Last update timestamp"),
-        ]
+        global _PROPERTIES
+        if _PROPERTIES is None:
+            from weaviate.classes.config import Property, DataType
+            
+            _PROPERTIES = (
+                Property(name="title", data_type=DataType.TEXT, description="The title/name of the recipe"),
+                Property(name="source", data_type=DataType.TEXT, description="The original URL or source of the recipe"),
+                Property(name="cuisine", data_type=DataType.TEXT, description="The cuisine type (e.g., italienisch, deutsch, asiatisch)"),
+                Property(name="prep_time", data_type=DataType.TEXT, description="Preparation time for the recipe"),
+                Property(name="cook_time", data_type=DataType.TEXT, description="Cooking time for the recipe"),
+                Property(name="servings", data_type=DataType.TEXT, description="Number of servings"),
+                Property(name="ingredients", data_type=DataType.TEXT, description="Recipe ingredients"),
+                Property(name="instructions", data_type=DataType.TEXT, description="Step-by-step cooking instructions"),
+                Property(name="tags", data_type=DataType.TEXT_ARRAY, description="Recipe tags"),
+                Property(name="content", data_type=DataType.TEXT, description="Full recipe content"),
+                Property(name="created_at", data_type=DataType.DATE, description="Creation timestamp"),
+                Property(name="updated_at", data_type=DataType.DATE, description="Last update timestamp"),
+            )
+        return _PROPERTIES
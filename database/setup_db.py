@@ -8,18 +8,16 @@ This script helps set up and manage the Weaviate database for the Recipe RAG sys
 import os
 import sys
 import argparse
+import asyncio
 import logging
 
 # Add current directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 def setup_logging(verbose=False):
-    """Setup logging configuration."""
-    level = logging.DEBUG if verbose else logging.INFO
-    logging.basicConfig(
-        level=level,
-        format='%(asctime)s - %(levelname)s - %(message)s'
-    )
+    """Setup logging configuration through the package's logging setup."""
+    from utils import setup_logging as configure_logging
+    configure_logging(level=logging.DEBUG if verbose else logging.INFO)
 
 def check_dependencies():
     """Check if required dependencies are installed."""
@@ -45,13 +43,25 @@ def setup_database_schema():
         print(f"❌ Failed to setup database schema: {e}")
         return False
 
-def load_sample_data(recipes_dir, batch_size=10):
-    """Load sample recipe data."""
+def load_sample_data(recipes_dir, batch_size=None, concurrency=None, log_every=10):
+    """
+    Load sample recipe data.
+    
+    batch_size is the number of recipes per insert request (default:
+    WEAVIATE_BATCH_SIZE). With a concurrency, recipes are inserted with the
+    async client, keeping that many insert requests in flight.
+    """
     try:
+        from config import WeaviateConfig
         from loaders import RecipeDataLoader
         print(f"📚 Loading sample recipes from: {recipes_dir}")
-        loader = RecipeDataLoader()
-        stats = loader.load_recipes_from_directory(recipes_dir, batch_size=batch_size)
+        loader = RecipeDataLoader(WeaviateConfig(batch_size=batch_size))
+        if concurrency:
+            stats = asyncio.run(loader.aload_recipes_from_directory(
+                recipes_dir, inflight=concurrency, log_every=log_every
+            ))
+        else:
+            stats = loader.load_recipes_from_directory(recipes_dir, log_every=log_every)
         
         print(f"Loading completed:")
         print(f"  Successful: {stats['successful']}")
@@ -109,7 +119,11 @@ def main():
     parser.add_argument("--check-deps", action="store_true", help="Check dependencies")
     parser.add_argument("--setup-schema", action="store_true", help="Setup database schema")
     parser.add_argument("--load-data", help="Load sample data from directory")
-    parser.add_argument("--batch-size", type=int, default=10, help="Batch size for loading")
+    parser.add_argument("--batch-size", "--insert-batch-size", dest="batch_size", type=int, default=None,
+                        help="Recipes per insert request (default: WEAVIATE_BATCH_SIZE)")
+    parser.add_argument("--log-every", type=int, default=10, help="Number of parsed files between progress messages")
+    parser.add_argument("--concurrency", type=int, default=None,
+                        help="Insert with the async client, keeping this many requests in flight")
     parser.add_argument("--health-check", action="store_true", help="Check database health")
     parser.add_argument("--count", action="store_true", help="Count recipes in database")
     parser.add_argument("--full-setup", action="store_true", help="Run full setup process")
@@ -137,7 +151,7 @@ def main():
     if args.load_data or args.full_setup:
         data_dir = args.load_data or "../recipe-parser/data/recipes"
         if os.path.exists(data_dir):
-            if not load_sample_data(data_dir, args.batch_size):
+            if not load_sample_data(data_dir, args.batch_size, args.concurrency, args.log_every):
                 print("⚠️  Failed to load some or all recipes")
         else:
             print(f"❌ Recipe directory not found: {data_dir}")
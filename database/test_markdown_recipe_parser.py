@@ -0,0 +1,221 @@
+"""
+Tests for the markdown recipe parser.
+
+Run from the repository root with: python -m pytest database/test_markdown_recipe_parser.py
+"""
+
+import os
+
+import pytest
+
+from database.loaders import markdown_recipe_parser
+from database.loaders.markdown_recipe_parser import MarkdownRecipeParser
+
+
+RECIPE = """---
+title: {title}
+source: https://example.com/carbonara
+cuisine: Italian
+---
+
+## Ingredients
+- 200 g spaghetti
+
+## Instructions
+1. Cook the pasta.
+"""
+
+
+@pytest.fixture(autouse=True)
+def clear_parse_memo():
+    # parse_recipe_file memoizes by path, mtime and size within the process
+    markdown_recipe_parser._parse_file_cached.cache_clear()
+    yield
+    markdown_recipe_parser._parse_file_cached.cache_clear()
+
+
+def write_recipe(path, title, mtime_ns=None):
+    path.write_text(RECIPE.format(title=title), encoding='utf-8')
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+# Parse cache
+
+def parse_cached(path, cache_dir):
+    stat = os.stat(path)
+    return MarkdownRecipeParser._parse_file(os.fspath(path), stat.st_mtime_ns, stat.st_size, os.fspath(cache_dir))
+
+
+def test_unchanged_file_is_read_from_cache(tmp_path):
+    recipe_path = tmp_path / "recipe.md"
+    cache_dir = tmp_path / "cache"
+    write_recipe(recipe_path, "Carbonara", mtime_ns=1_000_000_000)
+    assert parse_cached(recipe_path, cache_dir).title == "Carbonara"
+
+    # Same size and mtime: the cached parse is used, not the new content
+    write_recipe(recipe_path, "Carbonaro", mtime_ns=1_000_000_000)
+    assert parse_cached(recipe_path, cache_dir).title == "Carbonara"
+    assert not list(cache_dir.glob("*.tmp"))
+
+
+def test_changed_mtime_misses_cache(tmp_path):
+    recipe_path = tmp_path / "recipe.md"
+    cache_dir = tmp_path / "cache"
+    write_recipe(recipe_path, "Carbonara", mtime_ns=1_000_000_000)
+    parse_cached(recipe_path, cache_dir)
+
+    write_recipe(recipe_path, "Amatrice", mtime_ns=2_000_000_000)
+    assert parse_cached(recipe_path, cache_dir).title == "Amatrice"
+
+
+def test_changed_size_misses_cache(tmp_path):
+    recipe_path = tmp_path / "recipe.md"
+    cache_dir = tmp_path / "cache"
+    write_recipe(recipe_path, "Carbonara", mtime_ns=1_000_000_000)
+    parse_cached(recipe_path, cache_dir)
+
+    write_recipe(recipe_path, "Carbonara alla romana", mtime_ns=1_000_000_000)
+    assert parse_cached(recipe_path, cache_dir).title == "Carbonara alla romana"
+
+
+def test_corrupt_cache_file_is_reparsed_and_replaced(tmp_path):
+    recipe_path = tmp_path / "recipe.md"
+    cache_dir = tmp_path / "cache"
+    write_recipe(recipe_path, "Carbonara")
+    parse_cached(recipe_path, cache_dir)
+    (cache_file,) = cache_dir.glob("*.pkl")
+    cache_file.write_bytes(b"not a pickle")
+
+    recipe = MarkdownRecipeParser.parse_recipe_file(recipe_path, cache_dir=os.fspath(cache_dir))
+
+    assert recipe is not None and recipe.title == "Carbonara"
+    assert MarkdownRecipeParser._load_cached(cache_file, (markdown_recipe_parser._PARSE_CACHE_VERSION,
+                                                          recipe_path.stat().st_mtime_ns,
+                                                          recipe_path.stat().st_size)) == recipe
+
+
+# Sections
+
+def test_header_on_first_line_starts_a_section():
+    sections = MarkdownRecipeParser.extract_sections("## Zutaten\n- 200 g Spaghetti\n- 2 Eier")
+
+    assert sections['ingredients'] == "- 200 g Spaghetti\n- 2 Eier"
+
+
+def test_text_before_the_first_header_is_ignored():
+    sections = MarkdownRecipeParser.extract_sections("Intro\n### Ingredients\n- pasta")
+
+    assert sections == {'ingredients': "- pasta", 'instructions': '', 'tags': []}
+
+
+def test_repeated_header_keeps_the_last_section():
+    sections = MarkdownRecipeParser.extract_sections(
+        "## Zutaten\n- a\n\n## Zubereitung\n1. Kochen\n\n## Zutaten\n- b\n"
+    )
+
+    assert sections['ingredients'] == "- b"
+    assert sections['instructions'] == "1. Kochen"
+
+
+def test_repeated_empty_header_keeps_the_earlier_section():
+    sections = MarkdownRecipeParser.extract_sections("## Zutaten\n- a\n## Zutaten\n## Notizen\nx")
+
+    assert sections['ingredients'] == "- a"
+
+
+def test_tag_lines_are_collected_and_dropped_from_sections():
+    sections = MarkdownRecipeParser.extract_sections(
+        "## Ingredients\n- a\n`vegan` `quick`\n- b\n## Notes\n`dinner`\n## Instructions\n`only`"
+    )
+
+    assert sections['ingredients'] == "- a\n- b"
+    # A section holding only tag lines keeps its default
+    assert sections['instructions'] == ''
+    assert sections['tags'] == ['vegan', 'quick', 'dinner', 'only']
+
+
+def test_crlf_headers_are_recognized():
+    sections = MarkdownRecipeParser.extract_sections(
+        "## Zutaten\r\n- a\r\n`vegan`\r\n## Zubereitung\r\n1. Kochen\r\n"
+    )
+
+    assert sections['ingredients'] == "- a"
+    assert sections['instructions'] == "1. Kochen"
+    assert sections['tags'] == ['vegan']
+
+
+def test_crlf_file_is_parsed_like_lf(tmp_path):
+    lf_path = tmp_path / "lf.md"
+    crlf_path = tmp_path / "crlf.md"
+    write_recipe(lf_path, "Carbonara")
+    crlf_path.write_bytes(lf_path.read_bytes().replace(b'\n', b'\r\n'))
+
+    lf = MarkdownRecipeParser.parse_recipe_file(lf_path)
+    crlf = MarkdownRecipeParser.parse_recipe_file(crlf_path)
+
+    assert crlf.ingredients == lf.ingredients == "- 200 g spaghetti"
+    assert crlf.instructions == lf.instructions == "1. Cook the pasta."
+    assert crlf.content == lf.content
+
+
+# Frontmatter
+
+def test_flat_frontmatter_is_read_as_text():
+    frontmatter, body = MarkdownRecipeParser.parse_frontmatter(
+        "---\ntitle: \"Carbonara\"\nservings: 4\nsource: https://example.com/a\n---\n\nBody"
+    )
+
+    assert frontmatter == {'title': 'Carbonara', 'servings': '4', 'source': 'https://example.com/a'}
+    assert body == "Body"
+
+
+def test_invalid_yaml_falls_back_to_line_parsing():
+    frontmatter, _ = MarkdownRecipeParser.parse_frontmatter(
+        "---\ntitle: Carbonara\ntags: [vegan, quick\ncuisine: Italian\n---\nBody"
+    )
+
+    assert frontmatter['title'] == 'Carbonara'
+    assert frontmatter['cuisine'] == 'Italian'
+
+
+def test_yaml_frontmatter_values_are_converted_to_text(tmp_path):
+    recipe_path = tmp_path / "recipe.md"
+    recipe_path.write_text(
+        "---\n"
+        "title: 2024\n"
+        "source: https://example.com/a\n"
+        "cuisine:\n  - Italian\n  - Roman\n"
+        "servings: 4\n"
+        "prep_time: 2024-01-02\n"
+        "cook_time: 1.5\n"
+        "---\n\n## Zutaten\n- a\n",
+        encoding='utf-8',
+    )
+
+    recipe = MarkdownRecipeParser.parse_recipe_file(recipe_path)
+
+    assert recipe.title == '2024'
+    assert recipe.cuisine == 'Italian, Roman'
+    assert recipe.servings == '4'
+    assert recipe.prep_time == '2024-01-02'
+    assert recipe.cook_time == '1.5'
+
+
+def test_frontmatter_tag_list_comes_before_body_tags(tmp_path):
+    recipe_path = tmp_path / "recipe.md"
+    recipe_path.write_text(
+        "---\ntitle: Carbonara\nsource: s\ncuisine: c\ntags:\n  - pasta\n  - 2024\n---\n\n"
+        "## Zutaten\n- a\n`quick`\n",
+        encoding='utf-8',
+    )
+
+    recipe = MarkdownRecipeParser.parse_recipe_file(recipe_path)
+
+    assert recipe.tags == ('pasta', '2024', 'quick')
+
+
+def test_frontmatter_tag_string_is_split_on_commas():
+    assert MarkdownRecipeParser._tags("[pasta, quick]") == ['pasta', 'quick']
+    assert MarkdownRecipeParser._tags("pasta") == ['pasta']
+    assert MarkdownRecipeParser._tags(None) == []
@@ -0,0 +1,150 @@
+"""
+Tests for insert retries in the recipe vector database client.
+
+Run from the repository root with: python -m pytest database/test_recipe_vector_database.py
+"""
+
+import asyncio
+import dataclasses
+import types
+
+import pytest
+
+from database.core import recipe_vector_database
+from database.core.recipe_vector_database import (
+    RecipeVectorDatabase,
+    _RETRY_INITIAL_DELAY,
+    _RETRY_MAX_DELAY,
+    _is_transient_error,
+    _retry_delay,
+)
+from database.models import RecipeDocument
+
+
+class StatusError(Exception):
+    """Stand-in for an error carrying an HTTP status, like UnexpectedStatusCodeError."""
+
+    def __init__(self, status_code):
+        super().__init__(f"status {status_code}")
+        self.status_code = status_code
+
+
+# Transient errors and backoff
+
+@pytest.mark.parametrize("error", [
+    ConnectionError("reset"),
+    ConnectionResetError("reset"),
+    TimeoutError("slow"),
+    StatusError(429),
+    StatusError(500),
+    StatusError(503),
+])
+def test_transient_errors_are_retried(error):
+    assert _is_transient_error(error)
+
+
+@pytest.mark.parametrize("error", [
+    StatusError(400),
+    StatusError(401),
+    StatusError(422),
+    StatusError("500"),
+    ValueError("bad recipe"),
+])
+def test_other_errors_are_not_retried(error):
+    assert not _is_transient_error(error)
+
+
+def test_retry_delay_doubles_up_to_the_cap():
+    for attempt in range(12):
+        base = min(_RETRY_MAX_DELAY, _RETRY_INITIAL_DELAY * 2 ** attempt)
+        delay = _retry_delay(attempt)
+        assert base <= delay <= base + _RETRY_INITIAL_DELAY
+    assert _retry_delay(20) <= _RETRY_MAX_DELAY + _RETRY_INITIAL_DELAY
+
+
+# Async batch insert
+
+class FlakyData:
+    """Fake async collection data API whose first requests fail."""
+
+    def __init__(self, failures):
+        self.failures = list(failures)
+        self.calls = 0
+
+    async def insert_many(self, objects):
+        self.calls += 1
+        if self.failures:
+            raise self.failures.pop(0)
+        return types.SimpleNamespace(uuids={i: obj.uuid for i, obj in enumerate(objects)},
+                                     has_errors=False, errors={})
+
+
+@pytest.fixture
+def database(monkeypatch):
+    pytest.importorskip("weaviate")
+    monkeypatch.setattr(recipe_vector_database, "SETTINGS",
+                        dataclasses.replace(recipe_vector_database.SETTINGS, WEAVIATE_BATCH_RETRIES=2))
+    delays = []
+
+    async def no_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(recipe_vector_database.asyncio, "sleep", no_sleep)
+    db = RecipeVectorDatabase()
+    db.config.batch_size = 10
+    db.manager.invalidate_count_cache = lambda: None
+    db.delays = delays
+    return db
+
+
+def weaviate_status_error(status_code):
+    from weaviate.exceptions import WeaviateBaseError
+
+    error = WeaviateBaseError(f"status {status_code}")
+    error.status_code = status_code
+    return error
+
+
+def make_recipes(count):
+    return [RecipeDocument(f"Recipe {i}", "https://example.com", "Italian", "content") for i in range(count)]
+
+
+def run_insert(db, failures, count=3):
+    data = FlakyData(failures)
+    db._async_collection = types.SimpleNamespace(data=data)
+    return asyncio.run(db.aadd_recipes_batch(make_recipes(count))), data
+
+
+def test_transient_failures_are_retried_until_success(database):
+    result, data = run_insert(database, [ConnectionError("reset"), weaviate_status_error(503)])
+
+    assert result == {"successful": 3, "total": 3, "errors": []}
+    assert data.calls == 3
+    assert len(database.delays) == 2
+
+
+def test_retries_stop_after_the_configured_attempts(database):
+    result, data = run_insert(database, [ConnectionError("reset")] * 5)
+
+    assert result["successful"] == 0
+    assert result["errors"] == ["reset"]
+    assert data.calls == 3
+
+
+def test_client_errors_fail_without_retry(database):
+    result, data = run_insert(database, [weaviate_status_error(422)])
+
+    assert result["successful"] == 0
+    assert len(result["errors"]) == 1
+    assert data.calls == 1
+    assert database.delays == []
+
+
+def test_negative_retry_setting_still_sends_each_chunk_once(database, monkeypatch):
+    monkeypatch.setattr(recipe_vector_database, "SETTINGS",
+                        dataclasses.replace(recipe_vector_database.SETTINGS, WEAVIATE_BATCH_RETRIES=-1))
+
+    result, data = run_insert(database, [])
+
+    assert result == {"successful": 3, "total": 3, "errors": []}
+    assert data.calls == 1
@@ -0,0 +1,193 @@
+"""
+Tests for the two-tier search result cache.
+
+Run from the repository root with: python -m pytest database/test_semantic_cache.py
+"""
+
+import threading
+import time
+import types
+import uuid
+
+import pytest
+
+from database.core import semantic_cache
+from database.core.recipe_vector_database import RecipeHit
+from database.core.semantic_cache import SemanticCache
+
+
+class FakeClock:
+    """Monotonic clock that only moves when told to."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(semantic_cache, "time", types.SimpleNamespace(monotonic=fake.monotonic))
+    return fake
+
+
+def make_hits(*titles):
+    return [RecipeHit(uuid.uuid4(), {"title": title, "tags": ["pasta"]}) for title in titles]
+
+
+def unit(*values):
+    np = pytest.importorskip("numpy")
+    vector = np.asarray(values, dtype=np.float32)
+    return vector / np.linalg.norm(vector)
+
+
+KEY = (10, 0.7, None)
+
+
+# Exact tier
+
+def test_exact_hit_returns_stored_results(clock):
+    cache = SemanticCache(exact_size=4)
+    hits = make_hits("Carbonara")
+    cache.put_exact("pasta", KEY, hits)
+
+    assert cache.get_exact("pasta", KEY) == hits
+    assert cache.get_exact("Pasta", KEY) is None
+
+
+def test_exact_key_separates_limit_certainty_and_fields(clock):
+    cache = SemanticCache(exact_size=8)
+    cache.put_exact("pasta", (10, 0.7, None), make_hits("A"))
+
+    assert cache.get_exact("pasta", (5, 0.7, None)) is None
+    assert cache.get_exact("pasta", (10, 0.8, None)) is None
+    assert cache.get_exact("pasta", (10, 0.7, ("title",))) is None
+    assert cache.get_exact("pasta", (10, 0.7, None)) is not None
+
+
+def test_exact_entries_expire_after_ttl(clock):
+    cache = SemanticCache(exact_size=4, ttl=60)
+    cache.put_exact("pasta", KEY, make_hits("A"))
+
+    clock.now += 59
+    assert cache.get_exact("pasta", KEY) is not None
+    clock.now += 1
+    assert cache.get_exact("pasta", KEY) is None
+
+
+def test_exact_tier_evicts_least_recently_used(clock):
+    cache = SemanticCache(exact_size=2)
+    cache.put_exact("a", KEY, make_hits("A"))
+    cache.put_exact("b", KEY, make_hits("B"))
+    cache.get_exact("a", KEY)
+    cache.put_exact("c", KEY, make_hits("C"))
+
+    assert cache.get_exact("a", KEY) is not None
+    assert cache.get_exact("b", KEY) is None
+    assert cache.get_exact("c", KEY) is not None
+
+
+def test_exact_hits_are_copies(clock):
+    cache = SemanticCache(exact_size=4)
+    hits = make_hits("Carbonara")
+    cache.put_exact("pasta", KEY, hits)
+
+    # Mutating the stored list or a returned hit must not reach later hits
+    hits[0].properties["title"] = "changed"
+    returned = cache.get_exact("pasta", KEY)
+    returned[0].properties["tags"].append("changed")
+    returned.append(make_hits("extra")[0])
+
+    again = cache.get_exact("pasta", KEY)
+    assert len(again) == 1
+    assert again[0].properties == {"title": "Carbonara", "tags": ["pasta"]}
+
+
+# Semantic tier
+
+def test_semantic_hit_for_similar_query(clock):
+    cache = SemanticCache(max_size=4, threshold=0.95)
+    hits = make_hits("Carbonara")
+    cache.put(unit(1, 0, 0), KEY, hits)
+
+    assert cache.get(unit(1, 0.1, 0), KEY) == hits
+    assert cache.get(unit(0, 1, 0), KEY) is None
+
+
+def test_semantic_key_separates_search_parameters(clock):
+    cache = SemanticCache(max_size=4)
+    cache.put(unit(1, 0, 0), (10, 0.7, None), make_hits("A"))
+
+    assert cache.get(unit(1, 0, 0), (5, 0.7, None)) is None
+    assert cache.get(unit(1, 0, 0), (10, 0.9, None)) is None
+    assert cache.get(unit(1, 0, 0), (10, 0.7, ("title",))) is None
+
+
+def test_semantic_entries_expire_after_ttl(clock):
+    cache = SemanticCache(max_size=4, ttl=60)
+    cache.put(unit(1, 0, 0), KEY, make_hits("A"))
+
+    clock.now += 60
+    assert cache.get(unit(1, 0, 0), KEY) is None
+
+
+def test_semantic_tier_evicts_least_recently_used(clock):
+    cache = SemanticCache(max_size=2)
+    cache.put(unit(1, 0, 0), KEY, make_hits("A"))
+    clock.now += 1
+    cache.put(unit(0, 1, 0), KEY, make_hits("B"))
+    clock.now += 1
+    cache.get(unit(1, 0, 0), KEY)
+    clock.now += 1
+    cache.put(unit(0, 0, 1), KEY, make_hits("C"))
+
+    assert cache.get(unit(1, 0, 0), KEY) is not None
+    assert cache.get(unit(0, 1, 0), KEY) is None
+    assert cache.get(unit(0, 0, 1), KEY) is not None
+
+
+def test_semantic_hits_are_copies(clock):
+    cache = SemanticCache(max_size=4)
+    cache.put(unit(1, 0, 0), KEY, make_hits("Carbonara"))
+
+    cache.get(unit(1, 0, 0), KEY)[0].properties["title"] = "changed"
+
+    assert cache.get(unit(1, 0, 0), KEY)[0].properties["title"] == "Carbonara"
+
+
+def test_clear_drops_both_tiers(clock):
+    cache = SemanticCache(max_size=4, exact_size=4)
+    cache.put_exact("pasta", KEY, make_hits("A"))
+    cache.put(unit(1, 0, 0), KEY, make_hits("A"))
+
+    cache.clear()
+
+    assert cache.get_exact("pasta", KEY) is None
+    assert cache.get(unit(1, 0, 0), KEY) is None
+
+
+def test_model_is_loaded_once_by_concurrent_searches(monkeypatch):
+    np = pytest.importorskip("numpy")
+    loads = []
+
+    class SlowModel:
+        def embed(self, queries):
+            return [np.ones(3, dtype=np.float32) for _ in queries]
+
+    def load_model(self):
+        loads.append(1)
+        time.sleep(0.05)
+        return SlowModel()
+
+    monkeypatch.setattr(SemanticCache, "_load_model", load_model)
+    cache = SemanticCache()
+    threads = [threading.Thread(target=cache.embed, args=("pasta",)) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(loads) == 1
+    assert np.isclose(np.linalg.norm(cache.embed("pasta")), 1.0)
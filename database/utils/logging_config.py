@@ -17,24 +17,28 @@ def setup_logging(
     """
     Set up logging configuration for the database module.
     
+    The root handler is only installed once; later calls (e.g. from a script
+    and a test harness in the same process) just update the level.
+    
     Args:
         level: Logging level (default: INFO)
         format_string: Custom format string (optional)
         include_timestamp: Whether to include timestamp in logs
     """
-    if format_string is None:
-        if include_timestamp:
-            format_string = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        else:
-            format_string = '%(name)s - %(levelname)s - %(message)s'
-    
-    logging.basicConfig(
-        level=level,
-        format=format_string,
-        handlers=[
-            logging.StreamHandler(sys.stdout)
-        ]
-    )
+    if not logging.getLogger().hasHandlers():
+        if format_string is None:
+            if include_timestamp:
+                format_string = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+            else:
+                format_string = '%(name)s - %(levelname)s - %(message)s'
+        
+        logging.basicConfig(
+            level=level,
+            format=format_string,
+            handlers=[
+                logging.StreamHandler(sys.stdout)
+            ]
+        )
     
     # Set specific logger for database module
     logger = logging.getLogger('database')
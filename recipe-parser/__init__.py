@@ -10,7 +10,7 @@ from .extractors import JSONLDExtractor, HTMLExtractor
 from .formatters import GermanTextFormatter, MarkdownFormatter
 from .loaders import RecipeContentLoader
 from .utils import URLValidator
-from .main import parse_recipe, parse_recipes, parse_recipe_simple, RecipeResult
+from .main import parse_recipe, parse_recipes, iter_parsed_recipes, parse_recipe_simple, RecipeResult
 
 __version__ = "0.1.0"
 __author__ = "Recipe Manager Project"
@@ -26,6 +26,7 @@ __all__ = [
     "URLValidator",
     "parse_recipe",
     "parse_recipes", 
+    "iter_parsed_recipes",
     "parse_recipe_simple",
     "RecipeResult"
 ]
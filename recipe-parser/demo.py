@@ -7,13 +7,21 @@ the parsed markdown content as individual files.
 
 import asyncio
 import csv
+import logging
 import os
 import re
+import sys
 from pathlib import Path
 from urllib.parse import urlparse
 
 # Try importing from installed package first
-from main import parse_recipes
+from main import iter_parsed_recipes
+
+logger = logging.getLogger(__name__)
+
+# Characters removed from file names, and whitespace runs replaced by underscores
+INVALID_FILENAME_CHARS_RE = re.compile(r'[^\w\s\-äöüÄÖÜß]')
+WHITESPACE_RE = re.compile(r'\s+')
 
 def sanitize_filename(title: str, url: str) -> str:
     """Create a safe filename from recipe title and URL."""
@@ -28,8 +36,8 @@ def sanitize_filename(title: str, url: str) -> str:
     
     # Clean up the filename
     # Remove or replace invalid characters
-    filename = re.sub(r'[^\w\s\-äöüÄÖÜß]', '', filename)
-    filename = re.sub(r'\s+', '_', filename)  # Replace spaces with underscores
+    filename = INVALID_FILENAME_CHARS_RE.sub('', filename)
+    filename = WHITESPACE_RE.sub('_', filename)  # Replace spaces with underscores
     filename = filename.strip('_')  # Remove leading/trailing underscores
     
     # Ensure it's not empty and not too long
@@ -47,85 +55,137 @@ def load_recipe_urls(csv_path: str) -> list[tuple[str, str]]:
     if not os.path.exists(csv_path):
         raise FileNotFoundError(f"CSV file not found: {csv_path}")
     
-    with open(csv_path, 'r', encoding='utf-8') as file:
-        reader = csv.DictReader(file)
+    with open(csv_path, 'r', encoding='utf-8', newline='') as file:
+        # Plain rows with column indices avoid building a dict per row
+        reader = csv.reader(file)
+        header = next(reader, [])
+        if 'url' not in header:
+            return recipes
+        url_index = header.index('url')
+        title_index = header.index('title') if 'title' in header else None
+        
         for row in reader:
-            title = row.get('title', '').strip()
-            url = row.get('url', '').strip()
+            if len(row) <= url_index:
+                continue
+            url = row[url_index].strip()
             
             if url:  # Only add if URL is present
+                title = row[title_index].strip() if title_index is not None and title_index < len(row) else ''
                 recipes.append((title, url))
     
     return recipes
 
 
+# Files written at once while saving parsed recipes
+SAVE_CONCURRENCY = 32
+
+
+def reserve_filepath(output_path: Path, filename: str, taken: set[str]) -> Path:
+    """
+    Pick a path for a recipe file whose name is not taken yet.
+    
+    The name is added to taken before returning, so recipes saved concurrently
+    never pick the same file. The function does not await, so no other task can
+    run between the check and the reservation.
+    
+    Args:
+        output_path: Directory the recipe files are written to
+        filename: Preferred file name from sanitize_filename
+        taken: Names of files in the output directory, including those
+            handed out during this run
+        
+    Returns:
+        Path to write the recipe to
+    """
+    stem, suffix = os.path.splitext(filename)
+    candidate = filename
+    counter = 1
+    while candidate in taken:
+        candidate = f"{stem}_{counter}{suffix}"
+        counter += 1
+    taken.add(candidate)
+    return output_path / candidate
+
+
+def write_recipe_file(filepath: Path, content: str) -> None:
+    """Write recipe markdown to a file."""
+    with open(filepath, 'w', encoding='utf-8') as file:
+        file.write(content)
+
+
+async def _save_one(title: str, url: str, result: dict, semaphore: asyncio.Semaphore,
+                    output_path: Path, taken: set[str]) -> bool:
+    """
+    Save one parsed recipe as a markdown file.
+    
+    Args:
+        title: Recipe title from the CSV file
+        url: Recipe URL
+        result: Parsing result from parse_recipes
+        semaphore: Limits how many files are written at once
+        output_path: Directory the recipe files are written to
+        taken: Names of files in the output directory, including those
+            handed out during this run
+        
+    Returns:
+        True if the recipe was saved, False otherwise
+    """
+    if not result['success']:
+        logger.warning("\n📄 %s (%s)\n❌ Parse failed: %s", title or 'Untitled', url, result['error'])
+        return False
+    
+    filepath = reserve_filepath(output_path, sanitize_filename(title, url), taken)
+    
+    try:
+        async with semaphore:
+            await asyncio.to_thread(write_recipe_file, filepath, result['content'])
+    except Exception as e:
+        logger.error("\n📄 %s (%s)\n❌ Failed to save: %s", title or 'Untitled', url, e)
+        return False
+    
+    logger.info("\n📄 %s (%s)\n✅ Saved: %s (%d characters)",
+                title or 'Untitled', url, filepath.name, len(result['content']))
+    return True
+
+
 async def save_parsed_recipes(recipes: list[tuple[str, str]], output_dir: str = "./data/recipes/"):
     """Parse recipes and save as individual markdown files."""
     # Create output directory
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
     
-    print(f"🇩🇪 German Recipe Parser - Batch Processing")
-    print("=" * 60)
-    print(f"📂 Input: {len(recipes)} recipes from CSV")
-    print(f"📁 Output directory: {output_path.absolute()}")
-    print("-" * 60)
+    logger.info("🇩🇪 German Recipe Parser - Batch Processing")
+    logger.info("=" * 60)
+    logger.info("📂 Input: %d recipes from CSV", len(recipes))
+    logger.info("📁 Output directory: %s", output_path.absolute())
+    logger.info("-" * 60)
     
-    # Extract URLs for batch processing
-    urls = [url for _, url in recipes]
-    
-    # Parse all recipes in batch
-    print("🔄 Starting batch parsing...")
-    results = await parse_recipes(urls)
-    
-    # Process and save results
-    saved_count = 0
-    failed_count = 0
-    
-    for (title, url), result in zip(recipes, results):
-        print(f"\n📄 Processing: {title or 'Untitled'}")
-        print(f"🔗 URL: {url}")
-        
-        if result['success']:
-            # Generate filename
-            filename = sanitize_filename(title, url)
-            filepath = output_path / filename
-            
-            # Handle duplicate filenames
-            counter = 1
-            original_filepath = filepath
-            while filepath.exists():
-                stem = original_filepath.stem
-                suffix = original_filepath.suffix
-                filepath = output_path / f"{stem}_{counter}{suffix}"
-                counter += 1
-            
-            # Save content
-            try:
-                with open(filepath, 'w', encoding='utf-8') as file:
-                    file.write(result['content'])
-                
-                print(f"✅ Saved: {filepath.name}")
-                print(f"📊 Size: {len(result['content'])} characters")
-                saved_count += 1
-                
-            except Exception as e:
-                print(f"❌ Failed to save: {e}")
-                failed_count += 1
-        else:
-            print(f"❌ Parse failed: {result['error']}")
-            failed_count += 1
+    # Save each recipe as soon as it is parsed, with a bounded number of open files
+    logger.info("🔄 Starting batch parsing...")
+    semaphore = asyncio.Semaphore(SAVE_CONCURRENCY)
+    # Existing names are read once, so picking a free name needs no stat calls
+    taken = {entry.name for entry in os.scandir(output_path)}
+    save_tasks = []
+    # Results arrive in completion order; the index finds each one's CSV title,
+    # also when the same URL is listed under several titles
+    async for index, url, result in iter_parsed_recipes([url for _, url in recipes]):
+        save_tasks.append(asyncio.create_task(
+            _save_one(recipes[index][0], url, result, semaphore, output_path, taken)
+        ))
+    saved = await asyncio.gather(*save_tasks)
+    saved_count = sum(saved)
+    failed_count = len(saved) - saved_count
     
     # Final summary
-    print("\n" + "=" * 60)
-    print("📋 BATCH PROCESSING SUMMARY:")
-    print(f"✅ Successfully saved: {saved_count}")
-    print(f"❌ Failed: {failed_count}")
-    print(f"📊 Total processed: {len(recipes)}")
-    print(f"📁 Files saved in: {output_path.absolute()}")
+    logger.info("\n" + "=" * 60)
+    logger.info("📋 BATCH PROCESSING SUMMARY:")
+    logger.info("✅ Successfully saved: %d", saved_count)
+    logger.info("❌ Failed: %d", failed_count)
+    logger.info("📊 Total processed: %d", len(recipes))
+    logger.info("📁 Files saved in: %s", output_path.absolute())
     
     if saved_count > 0:
-        print(f"\n💡 You can now find your parsed recipes in the output directory!")
+        logger.info("\n💡 You can now find your parsed recipes in the output directory!")
 
 
 async def demo():
@@ -136,18 +196,21 @@ async def demo():
         recipes = load_recipe_urls(csv_path)
         
         if not recipes:
-            print("❌ No recipes found in CSV file.")
+            logger.error("❌ No recipes found in CSV file.")
             return
         
         # Process and save recipes
         await save_parsed_recipes(recipes)
         
     except FileNotFoundError as e:
-        print(f"❌ Error: {e}")
-        print("� Make sure the CSV file exists at ./data/recipe_list.csv")
+        logger.error("❌ Error: %s", e)
+        logger.error("� Make sure the CSV file exists at ./data/recipe_list.csv")
     except Exception as e:
-        print(f"❌ Unexpected error: {e}")
+        logger.error("❌ Unexpected error: %s", e)
 
 
 if __name__ == "__main__":
+    # One handler for all progress messages, printed as plain lines to stdout
+    # as the demo's print output was, so "python demo.py > out.txt" captures it
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     asyncio.run(demo())
@@ -7,9 +7,65 @@ recipe data from HTML content, including JSON-LD structured data and CSS selecto
 
 import json
 import re
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, Iterable, List, Optional
 from bs4 import BeautifulSoup, Tag
 
+try:
+    # Try relative import first (when used as package)
+    from .formatters import GermanTextFormatter
+except ImportError:
+    # Fall back to absolute import (when run directly)
+    from formatters import GermanTextFormatter
+
+# Optional: orjson decodes JSON-LD blocks several times faster than json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Selectors that can be checked without a CSS engine: ".class" and [attr*="value"]
+_CLASS_SELECTOR_RE = re.compile(r'\.([\w-]+)')
+_ATTR_CONTAINS_SELECTOR_RE = re.compile(r'\[([\w-]+)\*="([^"]*)"\]')
+
+# Heuristics for the fallback extractors. Keywords are matched as substrings
+# of the lowercased text, so "min" also matches "Minuten".
+_NUMBERED_STEP_RE = re.compile(r'^\d+\.')
+_INGREDIENT_QUANTITY_RE = re.compile(r'\d+\s*(g|kg|ml|l|tl|el|stück|stk|prise|bund)')
+_INSTRUCTION_LIST_KEYWORDS = (
+    'min', 'grad', 'ofen', 'pfanne', 'topf', 'rühren', 'braten',
+    'kochen', 'schneiden', 'mischen', 'würzen', 'erhitzen', 'zutaten',
+    'aufkochen', 'garen', 'abgiessen', 'abtropfen', 'zugedeckt',
+    'weich', 'anbraten', 'dünsten', 'salzen',
+)
+_UI_KEYWORDS = (
+    'drucken', 'rezeptbuch', 'einkauf', 'startseite', 'navigation',
+    'sterne', 'bewertung', 'aktiv', 'gesamt', 'kontakt', 'impressum',
+)
+_INSTRUCTION_PARAGRAPH_KEYWORDS = (
+    'erhitzen', 'braten', 'kochen', 'backen', 'rühren', 'mischen',
+    'schneiden', 'würzen', 'zugeben', 'servieren', 'anbraten', 'dünsten',
+    'aufkochen', 'garen', 'abgiessen', 'abtropfen',
+)
+_INGREDIENT_KEYWORDS = ('salz', 'pfeffer', 'öl', 'butter', 'zwiebel', 'knoblauch', 'tomat')
+
+
+# ISO 8601 durations as used by schema.org, e.g. PT15M, PT1H30M or P0DT2H;
+# seconds are accepted but dropped from the readable text
+_ISO_DURATION_RE = re.compile(r'P(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:\d+(?:\.\d+)?S)?)?')
+
+# Contents of all JSON-LD blocks, read straight from an lxml tree
+_JSON_LD_XPATH = '//script[@type="application/ld+json"]/text()'
+
+
+def _json_loads(text: str) -> Any:
+    """Decode JSON with orjson when installed, falling back to json for what orjson rejects (e.g. NaN)."""
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
+
 
 class JSONLDExtractor:
     """Extracts recipe data from JSON-LD structured data."""
@@ -23,9 +79,35 @@ class JSONLDExtractor:
             recipe_data: Dictionary to populate with extracted data
         """
         json_scripts = soup.find_all('script', type='application/ld+json')
-        for script in json_scripts:
+        self.extract_from_texts((script.string for script in json_scripts), recipe_data)
+    
+    def extract_from_lxml(self, tree, recipe_data: Dict[str, Any]) -> None:
+        """
+        Extract recipe data from JSON-LD structured data in a parsed lxml tree.
+        
+        The script contents are read with XPath, so no BeautifulSoup tree is needed.
+        
+        Args:
+            tree: Root element from lxml.html
+            recipe_data: Dictionary to populate with extracted data
+        """
+        self.extract_from_texts(tree.xpath(_JSON_LD_XPATH), recipe_data)
+    
+    def extract_from_texts(self, texts: Iterable[Optional[str]], recipe_data: Dict[str, Any]) -> None:
+        """
+        Extract recipe data from the contents of JSON-LD script blocks.
+        
+        Args:
+            texts: Raw JSON text of each block
+            recipe_data: Dictionary to populate with extracted data
+        """
+        for text in texts:
+            # A block without the "Recipe" type string cannot hold a recipe, so
+            # breadcrumb, organization and page blocks are not decoded at all
+            if not text or '"Recipe"' not in text:
+                continue
             try:
-                data = json.loads(script.string)
+                data = _json_loads(text)
                 
                 # Handle single object or list of objects
                 if isinstance(data, list):
@@ -92,20 +174,12 @@ class JSONLDExtractor:
         Returns:
             Human-readable duration string in German
         """
-        if not duration_str.startswith('PT'):
+        match = _ISO_DURATION_RE.fullmatch(duration_str)
+        if not match:
             return duration_str
         
-        duration_str = duration_str[2:]  # Remove 'PT'
-        hours = 0
-        minutes = 0
-        
-        if 'H' in duration_str:
-            parts = duration_str.split('H')
-            hours = int(parts[0])
-            duration_str = parts[1] if len(parts) > 1 else ''
-        
-        if 'M' in duration_str:
-            minutes = int(duration_str.replace('M', ''))
+        days, hours, minutes = (int(group or 0) for group in match.groups())
+        hours += days * 24
         
         if hours > 0 and minutes > 0:
             return f"{hours} Std {minutes} Min"
@@ -141,6 +215,8 @@ class HTMLExtractor:
             '.kochzeit',
             '.vorbereitungszeit',
         ]
+        self._container_lookup = self._build_container_lookup(self.recipe_selectors)
+        self._formatter = GermanTextFormatter()
         
         self.field_selectors = {
             'title': [
@@ -199,8 +275,59 @@ class HTMLExtractor:
             if title_elem:
                 recipe_data['title'] = title_elem.get_text(strip=True)
     
+    @staticmethod
+    def _build_container_lookup(selectors: List[str]):
+        """
+        Index simple container selectors by their priority.
+        
+        Returns:
+            Tuple of ({class name: priority}, [(priority, attribute, substring)]),
+            or None if any selector needs the full CSS engine
+        """
+        classes = {}
+        attributes = []
+        for priority, selector in enumerate(selectors):
+            match = _CLASS_SELECTOR_RE.fullmatch(selector)
+            if match:
+                classes.setdefault(match.group(1), priority)
+                continue
+            match = _ATTR_CONTAINS_SELECTOR_RE.fullmatch(selector)
+            if match:
+                attributes.append((priority, match.group(1), match.group(2)))
+                continue
+            return None
+        return classes, attributes
+    
     def _find_recipe_container(self, soup: BeautifulSoup) -> Optional[Tag]:
-        """Find the main recipe container element."""
+        """
+        Find the main recipe container element.
+        
+        The earliest element matching the first selector with any match is
+        returned. With simple selectors, every element is ranked in a single
+        walk of the page instead of one CSS query (and walk) per selector.
+        """
+        if self._container_lookup is not None:
+            classes, attributes = self._container_lookup
+            best = None
+            best_priority = len(self.recipe_selectors)
+            for tag in soup.find_all(True):
+                priority = best_priority
+                for name in tag.get('class') or ():
+                    class_priority = classes.get(name)
+                    if class_priority is not None and class_priority < priority:
+                        priority = class_priority
+                for attr_priority, attribute, substring in attributes:
+                    if attr_priority < priority:
+                        value = tag.get(attribute)
+                        if value and substring in value:
+                            priority = attr_priority
+                if priority < best_priority:
+                    best = tag
+                    best_priority = priority
+                    if priority == 0:
+                        break
+            return best
+        
         for selector in self.recipe_selectors:
             try:
                 container = soup.select_one(selector)
@@ -230,19 +357,9 @@ class HTMLExtractor:
             if elem:
                 text = elem.get_text(strip=True)
                 if field in ['prep_time', 'cook_time']:
-                    try:
-                        from .formatters import GermanTextFormatter
-                    except ImportError:
-                        from formatters import GermanTextFormatter
-                    formatter = GermanTextFormatter()
-                    return formatter.normalize_time_text(text)
+                    return self._formatter.normalize_time_text(text)
                 elif field == 'servings':
-                    try:
-                        from .formatters import GermanTextFormatter
-                    except ImportError:
-                        from formatters import GermanTextFormatter
-                    formatter = GermanTextFormatter()
-                    return formatter.normalize_servings_text(text)
+                    return self._formatter.normalize_servings_text(text)
                 return text
         return ""
     
@@ -254,7 +371,7 @@ class HTMLExtractor:
         for selector in selectors:
             elems = container.select(selector)
             if elems:
-                texts = [elem.get_text(strip=True) for elem in elems if elem.get_text(strip=True)]
+                texts = [text for text in (elem.get_text(strip=True) for elem in elems) if text]
                 if texts:
                     return texts
         
@@ -281,17 +398,13 @@ class HTMLExtractor:
                 for item in items:
                     text = item.get_text(strip=True)
                     # Filter out very short texts that are likely not instructions
+                    if len(text) <= 20:
+                        continue
                     # Also check for cooking-related German keywords
-                    if (len(text) > 20 and 
-                        any(word in text.lower() for word in 
-                           ['min', 'grad', 'ofen', 'pfanne', 'topf', 'rühren', 'braten', 
-                            'kochen', 'schneiden', 'mischen', 'würzen', 'erhitzen', 'zutaten',
-                            'aufkochen', 'garen', 'abgiessen', 'abtropfen', 'zugedeckt',
-                            'weich', 'anbraten', 'dünsten', 'salzen', 'würzen']) and
+                    lowered = text.lower()
+                    if (any(word in lowered for word in _INSTRUCTION_LIST_KEYWORDS) and
                         # Exclude navigation or UI elements
-                        not any(ui_word in text.lower() for ui_word in 
-                               ['drucken', 'rezeptbuch', 'einkauf', 'startseite', 'navigation',
-                                'sterne', 'bewertung', 'aktiv', 'gesamt', 'kontakt', 'impressum'])):
+                        not any(ui_word in lowered for ui_word in _UI_KEYWORDS)):
                         texts.append(text)
                 
                 # If we found good instruction texts, return them
@@ -299,7 +412,7 @@ class HTMLExtractor:
                     return texts
         
         # Look for numbered paragraphs or divs
-        potential_steps = container.find_all(['p', 'div'], string=re.compile(r'^\d+\.'))
+        potential_steps = container.find_all(['p', 'div'], string=_NUMBERED_STEP_RE)
         if potential_steps:
             return [step.get_text(strip=True) for step in potential_steps]
         
@@ -308,11 +421,10 @@ class HTMLExtractor:
         instruction_paragraphs = []
         for p in all_paragraphs:
             text = p.get_text(strip=True)
-            if (len(text) > 30 and 
-                any(word in text.lower() for word in 
-                    ['erhitzen', 'braten', 'kochen', 'backen', 'rühren', 'mischen', 
-                     'schneiden', 'würzen', 'zugeben', 'servieren', 'anbraten', 'dünsten',
-                     'aufkochen', 'garen', 'abgiessen', 'abtropfen'])):
+            if len(text) <= 30:
+                continue
+            lowered = text.lower()
+            if any(word in lowered for word in _INSTRUCTION_PARAGRAPH_KEYWORDS):
                 instruction_paragraphs.append(text)
         
         return instruction_paragraphs
@@ -327,10 +439,10 @@ class HTMLExtractor:
                 texts = []
                 for item in items:
                     text = item.get_text(strip=True)
+                    lowered = text.lower()
                     # Check if text looks like an ingredient (has measurements or common words)
-                    if (re.search(r'\d+\s*(g|kg|ml|l|tl|el|stück|stk|prise|bund)', text.lower()) or
-                        any(word in text.lower() for word in 
-                            ['salz', 'pfeffer', 'öl', 'butter', 'zwiebel', 'knoblauch', 'tomat'])):
+                    if (_INGREDIENT_QUANTITY_RE.search(lowered) or
+                        any(word in lowered for word in _INGREDIENT_KEYWORDS)):
                         texts.append(text)
                 if len(texts) >= 3:  # Likely ingredients if multiple items found
                     return texts
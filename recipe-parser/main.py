@@ -6,14 +6,16 @@ from web URLs into LLM-friendly markdown format.
 """
 
 import asyncio
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, AsyncIterator, Tuple
 
 try:
     # Try relative import first (when used as package)
     from .parser import GermanRecipeParser
+    from .loaders import RecipeContentLoader
 except ImportError:
     # Fall back to absolute import (when run directly)
     from parser import GermanRecipeParser
+    from loaders import RecipeContentLoader
 
 
 class RecipeResult:
@@ -35,17 +37,18 @@ class RecipeResult:
         }
 
 
-async def parse_recipe(url: str) -> RecipeResult:
+async def parse_recipe(url: str, parser: Optional[GermanRecipeParser] = None) -> RecipeResult:
     """
     Parse a single German recipe from a URL.
     
     Args:
         url: The URL of the German recipe page to parse
+        parser: Optional parser to reuse, e.g. one sharing an HTTP session
         
     Returns:
         RecipeResult object containing success status, content, and error information
     """
-    parser = GermanRecipeParser()
+    parser = parser or GermanRecipeParser()
     try:
         content = await parser.parse_recipe_from_url(url)
         if content:
@@ -56,15 +59,27 @@ async def parse_recipe(url: str) -> RecipeResult:
         return RecipeResult(success=False, error=str(e), url=url)
 
 
-async def parse_recipes(urls: List[str]) -> List[Dict[str, Any]]:
+async def _cancel_pending(tasks: List[asyncio.Task]) -> None:
+    """Cancel unfinished tasks and wait for them, so none outlives the shared session."""
+    pending = [task for task in tasks if not task.done()]
+    for task in pending:
+        task.cancel()
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+async def parse_recipes(urls: List[str], concurrency: int = 8) -> List[Dict[str, Any]]:
     """
     Parse multiple German recipes from a list of URLs.
     
     This function processes URLs concurrently and returns results in the same order
     as the input URLs. Failed URLs will have success=False with error information.
+    All downloads share one HTTP session, so connections to the same site are
+    reused, and at most concurrency recipes are fetched at a time.
     
     Args:
         urls: List of URLs to parse recipes from
+        concurrency: Maximum number of recipes downloaded and parsed at once
         
     Returns:
         List of dictionaries containing parsing results in the same order as input URLs.
@@ -73,11 +88,24 @@ async def parse_recipes(urls: List[str]) -> List[Dict[str, Any]]:
     if not urls:
         return []
     
-    # Create tasks for concurrent processing
-    tasks = [parse_recipe(url) for url in urls]
+    semaphore = asyncio.Semaphore(concurrency)
     
-    # Wait for all tasks to complete
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+    async with RecipeContentLoader.create_session() as session:
+        parser = GermanRecipeParser(session)
+        
+        async def parse_bounded(url: str) -> RecipeResult:
+            async with semaphore:
+                return await parse_recipe(url, parser)
+        
+        # Create tasks for concurrent processing
+        tasks = [asyncio.create_task(parse_bounded(url)) for url in urls]
+        
+        # Wait for all tasks to complete
+        try:
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            # If cancelled, finish the downloads before the session is closed
+            await _cancel_pending(tasks)
     
     # Convert results to dictionaries, handling any exceptions
     formatted_results = []
@@ -103,6 +131,53 @@ async def parse_recipes(urls: List[str]) -> List[Dict[str, Any]]:
     return formatted_results
 
 
+async def iter_parsed_recipes(urls: List[str], concurrency: int = 8) -> AsyncIterator[Tuple[int, str, Dict[str, Any]]]:
+    """
+    Parse multiple German recipes and yield each result as soon as it is ready.
+    
+    Unlike parse_recipes, a slow site does not hold back the other results, so
+    callers can save recipes while the rest are still downloading. Results are
+    yielded in completion order, not input order; the index of each URL in
+    urls identifies its result even if a URL is listed more than once.
+    
+    Args:
+        urls: List of URLs to parse recipes from
+        concurrency: Maximum number of recipes downloaded and parsed at once
+        
+    Yields:
+        Tuples of (index, url, result) where result is a dictionary with keys
+        'success', 'content', 'error', 'url'
+    """
+    if not urls:
+        return
+    
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async with RecipeContentLoader.create_session() as session:
+        parser = GermanRecipeParser(session)
+        
+        async def parse_bounded(index: int, url: str) -> Tuple[int, str, Dict[str, Any]]:
+            try:
+                async with semaphore:
+                    result = await parse_recipe(url, parser)
+            except Exception as e:
+                return index, url, {
+                    'success': False,
+                    'content': None,
+                    'error': f"Unexpected error: {str(e)}",
+                    'url': url
+                }
+            return index, url, result.to_dict()
+        
+        tasks = [asyncio.create_task(parse_bounded(index, url)) for index, url in enumerate(urls)]
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                yield await next_result
+        finally:
+            # Stop outstanding downloads if the caller stops iterating early
+            await _cancel_pending(tasks)
+
+
 async def parse_recipe_simple(url: str) -> Optional[str]:
     """
     Simple convenience function that returns just the content string (backward compatibility).
@@ -5,9 +5,14 @@ Main parser class that orchestrates the recipe extraction process
 using specialized extractors and formatters.
 """
 
-from typing import Optional, Dict, Any
+import importlib.util
+import logging
+from typing import TYPE_CHECKING, Optional, Dict, Any
 from bs4 import BeautifulSoup
 
+if TYPE_CHECKING:
+    import aiohttp
+
 try:
     # Try relative imports first (when used as package)
     from .extractors import JSONLDExtractor, HTMLExtractor
@@ -22,6 +27,22 @@ except ImportError:
     from utils import URLValidator
 
 
+logger = logging.getLogger(__name__)
+
+# lxml builds the tree in C and is several times faster than html.parser
+if importlib.util.find_spec("lxml") is not None:
+    import lxml.etree
+    import lxml.html
+    HTML_PARSER = 'lxml'
+else:
+    HTML_PARSER = 'html.parser'
+    logger.warning("lxml is not installed, parsing HTML with the slower html.parser")
+
+
+# Fields HTMLExtractor fills when JSON-LD leaves them empty
+_HTML_FIELDS = ('title', 'description', 'ingredients', 'instructions', 'prep_time', 'cook_time', 'servings')
+
+
 class GermanRecipeParser:
     """
     A recipe parser optimized for German recipe websites.
@@ -36,9 +57,14 @@ class GermanRecipeParser:
     - Outputs markdown with German labels (Zutaten, Zubereitung, etc.)
     """
     
-    def __init__(self):
-        """Initialize the parser with German-specific extractors and formatters."""
-        self.content_loader = RecipeContentLoader()
+    def __init__(self, session: Optional["aiohttp.ClientSession"] = None):
+        """
+        Initialize the parser with German-specific extractors and formatters.
+        
+        Args:
+            session: Optional shared HTTP session used for all downloads
+        """
+        self.content_loader = RecipeContentLoader(session)
         self.json_ld_extractor = JSONLDExtractor()
         self.html_extractor = HTMLExtractor()
         self.markdown_formatter = MarkdownFormatter()
@@ -86,17 +112,37 @@ class GermanRecipeParser:
         Returns:
             Dictionary containing extracted recipe data
         """
-        soup = BeautifulSoup(html_content, 'lxml')
         recipe_data = self._initialize_recipe_data()
         
-        # Try JSON-LD extraction first (most reliable for structured data)
-        self.json_ld_extractor.extract(soup, recipe_data)
+        # Try JSON-LD extraction first (most reliable for structured data). With lxml
+        # the blocks are read from a plain lxml tree, which is much cheaper to build
+        # than a BeautifulSoup tree, and the soup is only built if fields are missing.
+        json_ld_done = False
+        if HTML_PARSER == 'lxml':
+            try:
+                tree = lxml.html.fromstring(html_content)
+            except (ValueError, lxml.etree.ParserError):
+                pass
+            else:
+                self.json_ld_extractor.extract_from_lxml(tree, recipe_data)
+                json_ld_done = True
+                if self._is_complete(recipe_data):
+                    return recipe_data
+        
+        soup = BeautifulSoup(html_content, HTML_PARSER)
+        if not json_ld_done:
+            self.json_ld_extractor.extract(soup, recipe_data)
         
         # Fill in missing data with HTML extraction
         self.html_extractor.extract(soup, recipe_data)
         
         return recipe_data
     
+    @staticmethod
+    def _is_complete(recipe_data: Dict[str, Any]) -> bool:
+        """Check whether every field the HTML extractor could fill is already set."""
+        return all(recipe_data[field] for field in _HTML_FIELDS)
+    
     def _initialize_recipe_data(self) -> Dict[str, Any]:
         """Initialize empty recipe data structure."""
         return {
@@ -6,20 +6,30 @@ a starting point for comprehensive testing.
 """
 
 import asyncio
+import aiohttp
 import pytest
+from aiohttp import web
+from bs4 import BeautifulSoup
 
 try:
     # Try relative imports first (when used as package)
     from .parser import GermanRecipeParser
+    from .loaders import RecipeContentLoader
+    from .extractors import HTMLExtractor, JSONLDExtractor
     from .utils import URLValidator
     from .formatters import GermanTextFormatter, MarkdownFormatter
-    from .main import parse_recipes, parse_recipe, RecipeResult
+    from .main import parse_recipes, parse_recipe, iter_parsed_recipes, RecipeResult
+    from . import demo, main
 except ImportError:
     # Fall back to absolute imports (when run directly)
     from parser import GermanRecipeParser
+    from loaders import RecipeContentLoader
+    from extractors import HTMLExtractor, JSONLDExtractor
     from utils import URLValidator
     from formatters import GermanTextFormatter, MarkdownFormatter
-    from main import parse_recipes, parse_recipe, RecipeResult
+    from main import parse_recipes, parse_recipe, iter_parsed_recipes, RecipeResult
+    import demo
+    import main
 
 
 class TestURLValidator:
@@ -144,9 +154,213 @@ class TestGermanRecipeParser:
         assert isinstance(recipe_data['instructions'], list)
 
 
+class TestJSONLDExtractor:
+    """Test JSON-LD value conversion."""
+    
+    @pytest.mark.parametrize("duration, expected", [
+        ("PT15M", "15 Min"),
+        ("PT1H30M", "1 Std 30 Min"),
+        ("PT2H", "2 Std"),
+        ("P0DT1H5M", "1 Std 5 Min"),
+        ("P1DT2H", "26 Std"),
+        ("PT20M30S", "20 Min"),
+        # Zero, malformed or non-ISO durations are returned unchanged
+        ("PT0M", "PT0M"),
+        ("P15M", "P15M"),
+        ("PT1.5H", "PT1.5H"),
+        ("20 Minuten", "20 Minuten"),
+    ])
+    def test_parse_duration(self, duration, expected):
+        """Test ISO 8601 durations are converted to German text."""
+        assert JSONLDExtractor()._parse_duration(duration) == expected
+
+
+class TestHTMLExtractor:
+    """Test recipe container lookup."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.extractor = HTMLExtractor()
+    
+    def _container(self, html):
+        return self.extractor._find_recipe_container(BeautifulSoup(html, 'html.parser'))
+    
+    def test_container_lookup_indexes_simple_selectors(self):
+        """Test simple selectors are indexed by priority."""
+        classes, attributes = HTMLExtractor._build_container_lookup(
+            ['[itemtype*="Recipe"]', '.recipe', '.rezept', '.recipe']
+        )
+        
+        assert classes == {'recipe': 1, 'rezept': 2}
+        assert attributes == [(0, 'itemtype', 'Recipe')]
+    
+    def test_container_lookup_rejects_complex_selectors(self):
+        """Test selectors needing the CSS engine disable the lookup."""
+        assert HTMLExtractor._build_container_lookup(['.recipe', 'div > article']) is None
+    
+    def test_higher_priority_selector_wins_over_earlier_element(self):
+        """Test a lower-priority match earlier in the page loses."""
+        container = self._container(
+            '<div class="zubereitung" id="first"></div>'
+            '<div class="recipe-card" id="second"></div>'
+            '<div class="recipe" id="third"></div>'
+        )
+        
+        assert container['id'] == 'third'
+    
+    def test_earliest_element_wins_within_a_priority(self):
+        """Test the first element matching the best selector is returned."""
+        container = self._container(
+            '<div class="rezept" id="first"></div><div class="rezept" id="second"></div>'
+        )
+        
+        assert container['id'] == 'first'
+    
+    def test_top_priority_match_stops_the_walk(self):
+        """Test the walk ends at the first priority-0 match."""
+        soup = BeautifulSoup(
+            '<div itemtype="https://schema.org/Recipe" id="first"></div>'
+            '<div itemtype="https://schema.org/Recipe" id="second"></div>',
+            'html.parser'
+        )
+        visited = []
+        find_all = soup.find_all
+        
+        def tracking_find_all(*args, **kwargs):
+            for tag in find_all(*args, **kwargs):
+                visited.append(tag)
+                yield tag
+        
+        soup.find_all = tracking_find_all
+        container = self.extractor._find_recipe_container(soup)
+        
+        assert container['id'] == 'first'
+        assert len(visited) == 1
+    
+    def test_no_container(self):
+        """Test pages without a matching element give None."""
+        assert self._container('<div class="content"><p>Text</p></div>') is None
+    
+    def test_complex_selectors_use_the_selector_loop(self):
+        """Test the CSS selector fallback keeps selector priority."""
+        self.extractor.recipe_selectors = ['div > article', '.recipe']
+        self.extractor._container_lookup = self.extractor._build_container_lookup(
+            self.extractor.recipe_selectors
+        )
+        
+        container = self._container(
+            '<div class="recipe" id="first"></div><div><article id="second"></article></div>'
+        )
+        
+        assert self.extractor._container_lookup is None
+        assert container['id'] == 'second'
+
+
+class TestRecipeContentLoader:
+    """Test page downloads against a local server."""
+    
+    @staticmethod
+    async def _serve():
+        """Start a server with a recipe page, an empty page and a missing page."""
+        async def recipe(request):
+            return web.Response(text="<h1>Rezept</h1>", content_type="text/html")
+        
+        async def empty(request):
+            return web.Response(text="  ", content_type="text/html")
+        
+        async def missing(request):
+            return web.Response(text="<h1>Nicht gefunden</h1>", status=404, content_type="text/html")
+        
+        app = web.Application()
+        app.router.add_get("/recipe", recipe)
+        app.router.add_get("/empty", empty)
+        app.router.add_get("/missing", missing)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        return runner, f"http://127.0.0.1:{port}"
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("shared_session", [False, True])
+    async def test_error_status_and_empty_page_raise(self, shared_session):
+        """Test both download paths reject error pages and empty pages."""
+        runner, base_url = await self._serve()
+        try:
+            session = RecipeContentLoader.create_session() if shared_session else None
+            loader = RecipeContentLoader(session)
+            try:
+                assert await loader.load_content(f"{base_url}/recipe") == "<h1>Rezept</h1>"
+                with pytest.raises(aiohttp.ClientResponseError):
+                    await loader.load_content(f"{base_url}/missing")
+                with pytest.raises(Exception, match="No content"):
+                    await loader.load_content(f"{base_url}/empty")
+                with pytest.raises(aiohttp.ClientResponseError):
+                    await loader.load_multiple_contents([f"{base_url}/recipe", f"{base_url}/missing"])
+            finally:
+                if session is not None:
+                    await session.close()
+        finally:
+            await runner.cleanup()
+
+
 class TestBatchProcessing:
     """Test batch processing functionality."""
     
+    @staticmethod
+    def _slow_batch(monkeypatch):
+        """
+        Make parse_recipe finish the first URL at once and hang on the rest.
+        
+        Returns:
+            List filled with the tasks still unfinished when the session closes
+        """
+        async def slow_parse_recipe(url, parser=None):
+            if url != "https://example.com/fast":
+                await asyncio.sleep(60)
+            return RecipeResult(success=True, content="# Test Recipe", url=url)
+        
+        unfinished = []
+        
+        class FakeSession:
+            async def __aenter__(self):
+                return self
+            
+            async def __aexit__(self, *exc_info):
+                unfinished.extend(task for task in asyncio.all_tasks()
+                                  if 'parse_bounded' in task.get_coro().__qualname__ and not task.done())
+        
+        monkeypatch.setattr(main, "parse_recipe", slow_parse_recipe)
+        monkeypatch.setattr(main.RecipeContentLoader, "create_session", staticmethod(FakeSession))
+        return unfinished
+    
+    @pytest.mark.asyncio
+    async def test_iter_parsed_recipes_early_exit_awaits_pending(self, monkeypatch):
+        """Test stopping early finishes every download before the session closes."""
+        unfinished = self._slow_batch(monkeypatch)
+        urls = ["https://example.com/fast", "https://example.com/slow", "https://example.com/slower"]
+        
+        results = iter_parsed_recipes(urls)
+        index, _, _ = await results.__anext__()
+        await results.aclose()
+        
+        assert index == 0
+        assert unfinished == []
+    
+    @pytest.mark.asyncio
+    async def test_parse_recipes_cancel_awaits_pending(self, monkeypatch):
+        """Test cancelling a batch finishes every download before the session closes."""
+        unfinished = self._slow_batch(monkeypatch)
+        
+        batch = asyncio.create_task(parse_recipes(["https://example.com/slow"] * 3))
+        await asyncio.sleep(0.01)
+        batch.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await batch
+        
+        assert unfinished == []
+    
     @pytest.mark.asyncio
     async def test_parse_recipes_empty_list(self):
         """Test parsing with empty URL list."""
@@ -199,6 +413,71 @@ class TestBatchProcessing:
         assert fail_dict['content'] is None
 
 
+class TestDemo:
+    """Test saving parsed recipes from the demo script."""
+    
+    def test_reserve_filepath_skips_taken_names(self, tmp_path):
+        """Test names already taken get a numbered suffix."""
+        taken = {'Tomatensauce.md', 'Tomatensauce_1.md'}
+        
+        path = demo.reserve_filepath(tmp_path, 'Tomatensauce.md', taken)
+        
+        assert path == tmp_path / 'Tomatensauce_2.md'
+        assert 'Tomatensauce_2.md' in taken
+        assert demo.reserve_filepath(tmp_path, 'Pesto.md', taken) == tmp_path / 'Pesto.md'
+    
+    def test_save_parsed_recipes_keeps_duplicate_titles(self, tmp_path, monkeypatch):
+        """Test recipes with the same title and an existing file are all saved."""
+        (tmp_path / 'Tomatensauce.md').write_text('existing', encoding='utf-8')
+        
+        async def fake_iter_parsed_recipes(urls):
+            for index, url in reversed(list(enumerate(urls))):
+                yield index, url, {'success': True, 'content': f'# {url}', 'error': None, 'url': url}
+        
+        monkeypatch.setattr(demo, 'iter_parsed_recipes', fake_iter_parsed_recipes)
+        recipes = [
+            ('Tomatensauce', 'https://example.com/a'),
+            ('Tomatensauce', 'https://example.com/b'),
+        ]
+        
+        asyncio.run(demo.save_parsed_recipes(recipes, str(tmp_path)))
+        
+        files = {path.name: path.read_text(encoding='utf-8') for path in tmp_path.iterdir()}
+        assert files['Tomatensauce.md'] == 'existing'
+        assert sorted(files) == ['Tomatensauce.md', 'Tomatensauce_1.md', 'Tomatensauce_2.md']
+        assert {files['Tomatensauce_1.md'], files['Tomatensauce_2.md']} == {
+            '# https://example.com/a', '# https://example.com/b'
+        }
+
+
+    def test_save_parsed_recipes_keeps_titles_of_duplicate_urls(self, tmp_path, monkeypatch):
+        """Test a URL listed under two titles is saved under both."""
+        async def fake_iter_parsed_recipes(urls):
+            for index, url in enumerate(urls):
+                yield index, url, {'success': True, 'content': f'# {index}', 'error': None, 'url': url}
+        
+        monkeypatch.setattr(demo, 'iter_parsed_recipes', fake_iter_parsed_recipes)
+        recipes = [
+            ('Pesto', 'https://example.com/pesto'),
+            ('Pesto Genovese', 'https://example.com/pesto'),
+        ]
+        
+        asyncio.run(demo.save_parsed_recipes(recipes, str(tmp_path)))
+        
+        assert (tmp_path / 'Pesto.md').read_text(encoding='utf-8') == '# 0'
+        assert (tmp_path / 'Pesto_Genovese.md').read_text(encoding='utf-8') == '# 1'
+    
+    @pytest.mark.asyncio
+    async def test_iter_parsed_recipes_yields_input_index(self):
+        """Test each result carries the index of its URL, duplicates included."""
+        urls = ["not-a-url", "", "not-a-url"]
+        
+        results = [item async for item in iter_parsed_recipes(urls)]
+        
+        assert sorted((index, url) for index, url, _ in results) == list(enumerate(urls))
+        assert all(result['success'] is False for _, _, result in results)
+
+
 # Integration test (requires network access)
 class TestIntegration:
     """Integration tests that require network access."""